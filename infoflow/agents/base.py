@@ -20,6 +20,9 @@ evolution of truth assessments and trust dynamics in social media environments.
 """
 
 import logging
+from bisect import bisect
+from itertools import accumulate
+from operator import attrgetter, itemgetter, methodcaller, mul
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import mesa
@@ -48,6 +51,16 @@ except ImportError:
 # Set up module-level logger
 logger = logging.getLogger("trust_dynamics")
 
+_get_influence = attrgetter("influence")
+_get_truth_assessment = attrgetter("truth_assessment")
+
+# Media source types every citizen tracks trust in, in a fixed order
+MEDIA_SOURCE_TYPES = ("CorporateMediaAgent", "InfluencerAgent", "GovernmentMediaAgent")
+
+# Read a citizen's trust in each of MEDIA_SOURCE_TYPES, in that order, from its
+# trust_levels dict in a single call: get_media_trust(citizen.trust_levels)
+get_media_trust = itemgetter(*MEDIA_SOURCE_TYPES)
+
 
 class BaseAgent(mesa.Agent):
     """Base class for all agent types in the simulation."""
@@ -61,6 +74,10 @@ class BaseAgent(mesa.Agent):
         # Note: unique_id is automatically assigned in Mesa 3
         super().__init__(model)
 
+        # Set to track content IDs that have been received to prevent duplicates.
+        # Always present so sharing code can test membership without hasattr.
+        self.received_content_ids = set()
+
     def step(self):
         """Base step method to be implemented by subclasses."""
         pass
@@ -117,7 +134,9 @@ class CitizenAgent(BaseAgent):
         self.influence = influence
         self.social_conformity = social_conformity
 
-        # Trust tracking for different social media account types
+        # Trust tracking for different social media account types. All of
+        # MEDIA_SOURCE_TYPES are always present (see get_media_trust); other
+        # source types are added on first update.
         self.trust_levels = {
             "CorporateMediaAgent": 5.0,  # Corporate social media accounts
             "InfluencerAgent": 5.0,      # Social media influencers
@@ -126,16 +145,19 @@ class CitizenAgent(BaseAgent):
 
         # Content memory (recent information received)
         self.content_memory = []
-        
-        # Set to track content IDs that have been received to prevent duplicates
-        self.received_content_ids = set()
 
-        # Network relationships - will be populated by the model
-        self.neighbors = []
+        # Network relationships - will be populated by the model (as a tuple,
+        # since the network topology does not change during a run)
+        self.neighbors = ()
 
     def receive_information(self, content: Dict[str, Any], source: BaseAgent) -> bool:
         """Process incoming information.
 
+        Tracked content (content with a content_id) is never copied: every
+        recipient references the single central copy in model.content_tracker,
+        and per-recipient details (who delivered it) live in the citizen's own
+        content_memory entry.
+
         Args:
             content: Dictionary containing content properties
             source: Source agent who created the content
@@ -143,40 +165,45 @@ class CitizenAgent(BaseAgent):
         Returns:
             Whether the content was accepted (truth assessment updated)
         """
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: receive_information called with content from {source.__class__.__name__}"
-        )
-        
-        # Initialize content tracker if needed
-        if not hasattr(self.model, "content_tracker"):
-            self.model.content_tracker = {}
+        # Only format debug messages when debug logging is actually enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: receive_information called with content from {source.__class__.__name__}"
+            )
         
+        # Initialize content tracker if needed (InformationFlowModel creates it
+        # up front; standalone test models may not)
+        content_tracker = getattr(self.model, "content_tracker", None)
+        if content_tracker is None:
+            content_tracker = self.model.content_tracker = {}
+
         # Check if content has ID and if we've already processed it
-        if "content_id" in content:
-            content_id = content["content_id"]
+        content_id = content.get("content_id")
+        if content_id is not None:
             
             # Skip if already received - prevent duplicate processing
             if content_id in self.received_content_ids:
-                logger.debug(
-                    f"[DEBUG] CitizenAgent {self.unique_id}: Already received content {content_id}, skipping"
-                )
+                if debug:
+                    logger.debug(
+                        f"[DEBUG] CitizenAgent {self.unique_id}: Already received content {content_id}, skipping"
+                    )
                 # Increment the duplicates prevented counter if it exists
-                if hasattr(self.model, "duplicate_prevention_stats"):
-                    self.model.duplicate_prevention_stats["duplicates_prevented"] += 1
+                stats = getattr(self.model, "duplicate_prevention_stats", None)
+                if stats is not None:
+                    stats["duplicates_prevented"] += 1
                 return False
                 
-            # If content isn't in tracker yet, add it
-            if content_id not in self.model.content_tracker:
-                self.model.content_tracker[content_id] = content
-            
-            # Get the reference to use
-            content_ref = self.model.content_tracker[content_id]
+            # Get the central copy, adding this content if it isn't tracked yet
+            content_ref = content_tracker.setdefault(content_id, content)
             
             # Update tracking info in the central copy
-            content_ref["last_shared_step"] = getattr(self.model, "steps", 0)
+            content_ref["last_shared_step"] = self.model.steps
             
-            # Add this agent to spread path if not already there
-            if "spread_path" in content_ref and self.unique_id not in content_ref["spread_path"]:
+            # Add this agent to the spread path. The received_content_ids check
+            # above guarantees each citizen reaches this point at most once per
+            # content, so no O(path length) membership scan is needed.
+            if "spread_path" in content_ref:
                 content_ref["spread_path"].append(self.unique_id)
                 
             # Mark this content as received for future duplicate prevention
@@ -197,9 +224,10 @@ class CitizenAgent(BaseAgent):
         source_credibility = content.get("source_credibility", 0.5)
         source_authority = content.get("source_authority", 0.5)
 
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: Processing content with accuracy={content_accuracy:.4f}, bias={content_bias:.4f}, source_type={source_type}"
-        )
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: Processing content with accuracy={content_accuracy:.4f}, bias={content_bias:.4f}, source_type={source_type}"
+            )
 
         # Optional factors that might be present
         engagement_factor = content.get("engagement_factor", 1.0)
@@ -208,9 +236,10 @@ class CitizenAgent(BaseAgent):
         # Step 2: Apply source trust filter
         source_trust = self.trust_levels.get(source_type, 5.0) / 10.0
         trust_weight = source_trust * source_credibility * authority_factor
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: Trust weight = {trust_weight:.4f} (source_trust={source_trust:.4f}, credibility={source_credibility:.4f}, authority_factor={authority_factor:.4f})"
-        )
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: Trust weight = {trust_weight:.4f} (source_trust={source_trust:.4f}, credibility={source_credibility:.4f}, authority_factor={authority_factor:.4f})"
+            )
 
         # Step 3: Calculate confirmation bias effect
         # Measure alignment between content bias and agent truth assessment
@@ -253,15 +282,17 @@ class CitizenAgent(BaseAgent):
         random_value = self.model.random.random()
         content_accepted = random_value < acceptance_factor
 
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: Acceptance check: random={random_value:.4f}, acceptance_factor={acceptance_factor:.4f}, accepted={content_accepted}"
-        )
-
-        if content_accepted:
+        if debug:
             logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Content ACCEPTED - updating truth assessment and trust"
+                f"[DEBUG] CitizenAgent {self.unique_id}: Acceptance check: random={random_value:.4f}, acceptance_factor={acceptance_factor:.4f}, accepted={content_accepted}"
             )
 
+        if content_accepted:
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Content ACCEPTED - updating truth assessment and trust"
+                )
+
             # Step 6: Update truth assessment if content is accepted
             # Calculate how much to move truth assessment toward content bias
             # Truth seekers (positive values) are more influenced by content accuracy
@@ -300,9 +331,10 @@ class CitizenAgent(BaseAgent):
 
             # Calculate perceived accuracy (accuracy distorted by political bias)
             perceived_accuracy = content_accuracy * (1 - bias_distortion)
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Perceived accuracy={perceived_accuracy:.4f} (content_accuracy={content_accuracy:.4f}, bias_distortion={bias_distortion:.4f})"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Perceived accuracy={perceived_accuracy:.4f} (content_accuracy={content_accuracy:.4f}, bias_distortion={bias_distortion:.4f})"
+                )
 
             # Target truth assessment is primarily based on perceived accuracy (truth value)
             # with some influence from confirmation bias
@@ -321,9 +353,10 @@ class CitizenAgent(BaseAgent):
             # Ensure truth assessment stays in 0-1 range
             self.truth_assessment = max(0.0, min(1.0, self.truth_assessment))
 
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Truth assessment updated: {old_truth_assessment:.4f} → {self.truth_assessment:.4f} (change of {self.truth_assessment - old_truth_assessment:.4f})"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Truth assessment updated: {old_truth_assessment:.4f} → {self.truth_assessment:.4f} (change of {self.truth_assessment - old_truth_assessment:.4f})"
+                )
 
             # Step 7: Adjust confidence based on truth assessment change
             truth_assessment_change = abs(self.truth_assessment - old_truth_assessment)
@@ -332,29 +365,52 @@ class CitizenAgent(BaseAgent):
             if truth_assessment_change > 0.1:
                 old_confidence = self.confidence
                 self.confidence = max(1.0, self.confidence - 0.5)
-                logger.debug(
-                    f"[DEBUG] CitizenAgent {self.unique_id}: Large change in truth assessment, decreasing confidence: {old_confidence:.1f} → {self.confidence:.1f}"
-                )
+                if debug:
+                    logger.debug(
+                        f"[DEBUG] CitizenAgent {self.unique_id}: Large change in truth assessment, decreasing confidence: {old_confidence:.1f} → {self.confidence:.1f}"
+                    )
             # Small changes with high trust increase confidence slightly
             elif trust_weight > 0.7:
                 old_confidence = self.confidence
                 self.confidence = min(10.0, self.confidence + 0.3)
-                logger.debug(
-                    f"[DEBUG] CitizenAgent {self.unique_id}: Small change with high trust, increasing confidence: {old_confidence:.1f} → {self.confidence:.1f}"
-                )
+                if debug:
+                    logger.debug(
+                        f"[DEBUG] CitizenAgent {self.unique_id}: Small change with high trust, increasing confidence: {old_confidence:.1f} → {self.confidence:.1f}"
+                    )
 
             # Step 8: Update trust in source
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Calling update_trust for {source_type} with accuracy {content_accuracy:.4f}"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Calling update_trust for {source_type} with accuracy {content_accuracy:.4f}"
+                )
             self.update_trust(source_type, content_accuracy)
         else:
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Content REJECTED - no trust update"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Content REJECTED - no trust update"
+                )
 
         return content_accepted
 
+    @staticmethod
+    def broadcast_to(
+        recipients: List["CitizenAgent"], content: Dict[str, Any], source: BaseAgent
+    ) -> int:
+        """Deliver one piece of content to several citizens in a single loop.
+
+        Args:
+            recipients: Citizens to deliver the content to, in delivery order
+            content: Dictionary containing content properties
+            source: Agent delivering the content
+
+        Returns:
+            Number of recipients who accepted the content
+        """
+        # map() drives the loop and methodcaller() the per-recipient call from
+        # C, so the only Python frames left are the receive_information calls
+        deliver = methodcaller("receive_information", content, source)
+        return sum(map(deliver, recipients))
+
     def update_trust(self, source_type: str, perceived_accuracy: float):
         """Update trust in a source type based on perceived accuracy.
 
@@ -362,21 +418,25 @@ class CitizenAgent(BaseAgent):
             source_type: Type of source (string)
             perceived_accuracy: How accurate the agent perceives the content (0-1)
         """
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: update_trust called for {source_type} with accuracy {perceived_accuracy:.4f}"
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: update_trust called for {source_type} with accuracy {perceived_accuracy:.4f}"
+            )
 
         # If source type is not in trust_levels, initialize it
         if source_type not in self.trust_levels:
             self.trust_levels[source_type] = 5.0
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Source type {source_type} not in trust_levels, initializing to 5.0"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Source type {source_type} not in trust_levels, initializing to 5.0"
+                )
 
         current_trust = self.trust_levels[source_type]
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: Current trust for {source_type} = {current_trust:.4f}"
-        )
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: Current trust for {source_type} = {current_trust:.4f}"
+            )
 
         # Calculate trust adjustment based on perceived accuracy
         # Much more dramatic effect - this will make trust changes very noticeable
@@ -388,44 +448,50 @@ class CitizenAgent(BaseAgent):
             accuracy_impact = (
                 -1.0 - (0.4 - perceived_accuracy) * 5.0
             )  # Range: -1.0 to -3.0
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Low accuracy {perceived_accuracy:.4f}, negative impact: {accuracy_impact:.4f}"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Low accuracy {perceived_accuracy:.4f}, negative impact: {accuracy_impact:.4f}"
+                )
         elif perceived_accuracy > 0.6:
             # Strong positive impact for high accuracy
             accuracy_impact = (
                 1.0 + (perceived_accuracy - 0.6) * 5.0
             )  # Range: 1.0 to 3.0
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: High accuracy {perceived_accuracy:.4f}, positive impact: {accuracy_impact:.4f}"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: High accuracy {perceived_accuracy:.4f}, positive impact: {accuracy_impact:.4f}"
+                )
         else:
             # Small impact for middle accuracy
             accuracy_impact = (perceived_accuracy - 0.5) * 4.0  # Range: -0.4 to 0.4
-            logger.debug(
-                f"[DEBUG] CitizenAgent {self.unique_id}: Medium accuracy {perceived_accuracy:.4f}, small impact: {accuracy_impact:.4f}"
-            )
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CitizenAgent {self.unique_id}: Medium accuracy {perceived_accuracy:.4f}, small impact: {accuracy_impact:.4f}"
+                )
 
         # Critical thinkers adjust trust even more based on accuracy
         # Very high at max critical thinking (10)
         critical_factor = 0.5 + (self.critical_thinking / 10.0)  # Range: 0.5 to 1.5
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: Critical thinking factor: {critical_factor:.4f} (critical_thinking={self.critical_thinking:.1f})"
-        )
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: Critical thinking factor: {critical_factor:.4f} (critical_thinking={self.critical_thinking:.1f})"
+            )
 
         # Calculate trust adjustment - much more significant now
         trust_adjustment = (
             accuracy_impact * critical_factor
         )  # Range: roughly -4.5 to 4.5
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: Trust adjustment = {trust_adjustment:.4f}"
-        )
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: Trust adjustment = {trust_adjustment:.4f}"
+            )
 
         # Apply adjustment - allow bigger swings
         new_trust = max(0.0, min(10.0, current_trust + trust_adjustment))
-        logger.debug(
-            f"[DEBUG] CitizenAgent {self.unique_id}: New trust for {source_type} = {new_trust:.4f} (was {current_trust:.4f}, change of {new_trust - current_trust:.4f})"
-        )
+        if debug:
+            logger.debug(
+                f"[DEBUG] CitizenAgent {self.unique_id}: New trust for {source_type} = {new_trust:.4f} (was {current_trust:.4f}, change of {new_trust - current_trust:.4f})"
+            )
 
         # Store the updated trust value
         self.trust_levels[source_type] = new_trust
@@ -526,12 +592,11 @@ class CitizenAgent(BaseAgent):
             # Use the central copy from the content tracker
             selected_content = self.model.content_tracker[content_id]
             
-            # Update the spread path to include this agent
-            if "spread_path" in selected_content and self.unique_id not in selected_content["spread_path"]:
-                selected_content["spread_path"].append(self.unique_id)
-                
+            # No spread path update needed: this agent was appended to the path
+            # when it received the content.
+
             # Update the last_shared_step
-            selected_content["last_shared_step"] = getattr(self.model, "steps", 0)
+            selected_content["last_shared_step"] = self.model.steps
             
             # Note: We're no longer doing content modification (bias adjustment, accuracy degradation)
             # to avoid creating multiple versions. This simplifies the model but preserves core dynamics.
@@ -550,28 +615,19 @@ class CitizenAgent(BaseAgent):
         if not self.neighbors:
             return
 
-        # Collect truth assessments from connections, weighted by their influence
-        weighted_truth_assessments = []
-        total_weight = 0
-
-        for neighbor in self.neighbors:
-            # Influence acts as weight
-            weight = neighbor.influence
-            weighted_truth_assessments.append((neighbor.truth_assessment, weight))
-            total_weight += weight
+        # Influence of each connection acts as the weight of its truth
+        # assessment; map/sum keep the per-neighbor loop in C
+        neighbors = self.neighbors
+        weights = list(map(_get_influence, neighbors))
+        total_weight = sum(weights)
 
         # If no valid weights, return
         if total_weight == 0:
             return
 
         # Calculate weighted average truth assessment
-        network_truth_assessment = (
-            sum(
-                truth_assessment * weight
-                for truth_assessment, weight in weighted_truth_assessments
-            )
-            / total_weight
-        )
+        weighted_sum = sum(map(mul, map(_get_truth_assessment, neighbors), weights))
+        network_truth_assessment = weighted_sum / total_weight
 
         # Update own truth assessment based on social_conformity
         # Higher social_conformity means more influenced by network
@@ -618,7 +674,7 @@ class CitizenAgent(BaseAgent):
                 
                 # Find a media agent of this type
                 for agent in self.model.agents:
-                    if hasattr(agent, "publication_rate") and agent.__class__.__name__ == source_type:
+                    if getattr(agent, "SOURCE_TYPE", None) == source_type:
                         # Use the original content with this source
                         self.receive_information(selected_content, agent)
                         return
@@ -627,45 +683,55 @@ class CitizenAgent(BaseAgent):
                 return
                         
         # Legacy code only used as fallback if no content exists yet
-        # Get available media sources from the model
-        media_sources = []
+        # Get available media sources from the model, grouped by type. Each
+        # group is weighted by the trust in its type times its size, which
+        # gives every source the same chance as a per-source trust weighting
+        # without building a list of every media agent.
+        source_groups = []
+        group_weights = []
         for source_type in [
             "CorporateMediaAgent",
             "InfluencerAgent",
             "GovernmentMediaAgent",
         ]:
-            if hasattr(self.model, source_type.lower().replace("agent", "s")):
-                media_set = getattr(
-                    self.model, source_type.lower().replace("agent", "s")
+            media_set = getattr(
+                self.model, source_type.lower().replace("agent", "s"), None
+            )
+            if media_set:
+                source_groups.append(media_set)
+                group_weights.append(
+                    self.trust_levels.get(source_type, 5.0) * len(media_set)
                 )
-                if media_set:
-                    media_sources.extend(media_set)
 
-        if not media_sources:
+        if not source_groups:
             return
 
         # Only proceed with small probability (0.1%) to minimize content creation
         if self.model.random.random() > 0.001:
             return
 
-        # Select a source based on trust levels
-        trust_levels = [
-            self.trust_levels.get(agent.__class__.__name__, 5.0)
-            for agent in media_sources
-        ]
-
-        # Calculate total trust for normalization
-        total_trust = sum(trust_levels)
-        if total_trust == 0:
-            return
+        # Select a source type based on trust levels, then a source within it.
+        # A single bisect on the running totals replaces random.choices' setup;
+        # with only one candidate no random draw is needed at all.
+        if len(source_groups) == 1:
+            if group_weights[0] == 0:
+                return
+            media_set = source_groups[0]
+        else:
+            cum_weights = list(accumulate(group_weights))
+            total_weight = cum_weights[-1]
+            if total_weight == 0:
+                return
 
-        # Normalize to probabilities
-        probabilities = [trust / total_trust for trust in trust_levels]
+            media_set = source_groups[
+                bisect(cum_weights, self.model.random.random() * total_weight)
+            ]
 
-        # Select source
-        selected_source = self.model.random.choices(
-            media_sources, weights=probabilities, k=1
-        )[0]
+        media_list = list(media_set)
+        if len(media_list) == 1:
+            selected_source = media_list[0]
+        else:
+            selected_source = self.model.random.choice(media_list)
 
         # Request content directly - with very low probability (emergency fallback)
         if selected_source:
@@ -684,30 +750,33 @@ class CitizenAgent(BaseAgent):
             if "content_id" in shared_content:
                 content_id = shared_content["content_id"]
                 
-                # Share with neighbors who haven't seen it yet
+                # InformationFlowModel always provides the stats; standalone
+                # test models may not, so look them up once per share
+                stats = getattr(self.model, "duplicate_prevention_stats", None)
+
+                # Share with neighbors who haven't seen it yet, filtering and
+                # delivering in a single pass
                 share_count = 0
-                # Find neighbors who haven't received this content yet
-                unaware_neighbors = [n for n in self.neighbors 
-                                    if not hasattr(n, "received_content_ids") 
-                                    or content_id not in n.received_content_ids]
-                                    
-                # Early exit if no neighbors need the content
-                if not unaware_neighbors:
-                    if hasattr(self.model, "duplicate_prevention_stats"):
-                        self.model.duplicate_prevention_stats["duplicates_prevented"] += len(self.neighbors)
-                    return
-                
-                # Share with neighbors who haven't seen it
-                for neighbor in unaware_neighbors:
-                    result = neighbor.receive_information(shared_content, self)
-                    if result:
+                saw_unaware_neighbor = False
+                for neighbor in self.neighbors:
+                    if content_id in neighbor.received_content_ids:
+                        continue
+                    saw_unaware_neighbor = True
+                    if neighbor.receive_information(shared_content, self):
                         share_count += 1
-                        # Track successful shares
-                        if hasattr(self.model, "duplicate_prevention_stats"):
-                            self.model.duplicate_prevention_stats["successful_shares"] += 1
+
+                # Track successful shares with a single update per share call
+                if stats is not None and share_count:
+                    stats["successful_shares"] += share_count
+
+                # Early exit if no neighbors needed the content
+                if not saw_unaware_neighbor:
+                    if stats is not None:
+                        stats["duplicates_prevented"] += len(self.neighbors)
+                    return
                 
                 # Log sharing activity if any occurred
-                if share_count > 0:
+                if share_count > 0 and logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         f"[DEBUG] CitizenAgent {self.unique_id}: Shared content {content_id} with {share_count} neighbors who hadn't seen it yet"
                     )
@@ -755,6 +824,13 @@ class SocialMediaAgent(BaseAgent):
             Higher values mean content is created more frequently
     """
 
+    # Content source type, resolved once per class (see __init_subclass__)
+    SOURCE_TYPE = "SocialMediaAgent"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.SOURCE_TYPE = cls.__name__
+
     def __init__(
         self,
         model: mesa.Model,
@@ -808,7 +884,7 @@ class SocialMediaAgent(BaseAgent):
             "framing_bias": self.political_bias,  # Keep as -5 to 5 scale
             "source_authority": self.authority / 10.0,
             "source_credibility": self.credibility / 10.0,
-            "source_type": self.__class__.__name__,
+            "source_type": self.SOURCE_TYPE,
         }
 
     def publish_content(self) -> Optional[Dict[str, float]]:
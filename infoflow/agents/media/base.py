@@ -5,12 +5,16 @@ This module defines the foundation for all social media account types
 (corporate accounts, influencers, and government accounts) in the simulation.
 """
 
+import logging
+from array import array
 from typing import Any, Dict, List, Optional
 
 import mesa
 
 from infoflow.agents.base import BaseAgent, CitizenAgent
 
+logger = logging.getLogger("infoflow.media")
+
 
 class SocialMediaAgent(BaseAgent):
     """
@@ -23,8 +27,19 @@ class SocialMediaAgent(BaseAgent):
         truth_commitment (float): 0-10 scale of fact-checking threshold
         influence_reach (float): 0-1 scale of proportion of social media users reached
         publication_rate (float): 0-1 scale of frequency of content creation
+
+    The hosting model is expected to provide ``citizens`` (the agents content
+    is broadcast to) and ``content_seed_nodes`` (a dict of ``array("I")`` seed
+    node IDs keyed by content_id), as InformationFlowModel does.
     """
 
+    # Content source type, resolved once per class (see __init_subclass__)
+    SOURCE_TYPE = "SocialMediaAgent"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.SOURCE_TYPE = cls.__name__
+
     def __init__(
         self,
         model: mesa.Model,
@@ -55,50 +70,80 @@ class SocialMediaAgent(BaseAgent):
         self.influence_reach = influence_reach
         self.publication_rate = publication_rate
 
-    def create_content(self) -> Dict[str, float]:
-        """Create content based on agent properties.
+        # Per-agent counter used to build unique content IDs
+        self._content_counter = 0
 
-        Returns:
-            Content object with properties like accuracy, framing_bias, etc.
-        """
+    @property
+    def truth_commitment(self) -> float:
+        """Fact-checking threshold (0-10 scale)."""
+        return self._truth_commitment
+
+    @truth_commitment.setter
+    def truth_commitment(self, value: float):
+        self._truth_commitment = value
+        self._update_truth_commitment_cache()
+
+    def _update_truth_commitment_cache(self):
+        """Precompute the values create_content derives from truth_commitment."""
         # Base accuracy tied to truth commitment - dramatically different curve
         # For truth commitment < 3: accuracy drops sharply
         # For truth commitment > 7: accuracy rises sharply
-        if self.truth_commitment < 3.0:
+        truth_commitment = self._truth_commitment
+        if truth_commitment < 3.0:
             # Very low accuracy for low truth commitment (0.0 to 0.3)
-            base_accuracy = (self.truth_commitment / 10.0) * 0.3
-        elif self.truth_commitment > 7.0:
+            self._base_accuracy = (truth_commitment / 10.0) * 0.3
+        elif truth_commitment > 7.0:
             # Very high accuracy for high truth commitment (0.7 to 0.9)
-            base_accuracy = 0.7 + (self.truth_commitment - 7.0) / 10.0 * 0.2
+            self._base_accuracy = 0.7 + (truth_commitment - 7.0) / 10.0 * 0.2
         else:
             # Moderate middle range (0.3 to 0.7)
-            base_accuracy = 0.3 + (self.truth_commitment - 3.0) / 4.0 * 0.4
+            self._base_accuracy = 0.3 + (truth_commitment - 3.0) / 4.0 * 0.4
 
-        # Apply much smaller randomness - more consistent outcomes
+    def create_content(self) -> Dict[str, float]:
+        """Create content based on agent properties.
+
+        Content is a plain dict with a fixed set of keys so that it can be
+        shared by reference through model.content_tracker and serialized
+        directly by the web interface. Subclasses may add optional factors
+        (engagement_factor, authority_factor), and citizens update
+        last_shared_step and spread_path on the central copy.
+
+        Returns:
+            Content object with keys content_id, accuracy, framing_bias,
+            source_authority, source_credibility, source_type, created_step,
+            origin_id and spread_path
+        """
+        # Base accuracy is precomputed from truth commitment (see
+        # _update_truth_commitment_cache); apply much smaller randomness for
+        # more consistent outcomes
         random_generator = self.model.random
         random_range = 0.1
         actual_accuracy = min(
             1.0,
             max(
                 0.0,
-                base_accuracy + random_generator.uniform(-random_range, random_range),
+                self._base_accuracy
+                + random_generator.uniform(-random_range, random_range),
             ),
         )
 
         # Political bias (anti-Trump to pro-Trump scale) directly becomes the framing bias
         # We keep it on the -5 to 5 scale in the content for consistency with the spec
 
-        # Generate a unique content ID
-        content_id = f"content_{self.unique_id}_{getattr(self.model, 'steps', 0)}_{random_generator.randint(0, 10000)}"
-        
+        # Generate a unique content ID from a per-agent counter (no RNG draw).
+        # IDs stay strings because the web layer serializes and slices them.
+        self._content_counter += 1
+        step = self.model.steps
+        content_id = f"content_{self.unique_id}_{step}_{self._content_counter}"
+
         return {
             "content_id": content_id,                # Unique identifier for tracking
             "accuracy": actual_accuracy,
             "framing_bias": self.political_bias,     # Keep as -5 to 5 scale
             "source_authority": self.authority / 10.0,
             "source_credibility": self.credibility / 10.0,
-            "source_type": self.__class__.__name__,
-            "created_step": getattr(self.model, "steps", 0),  # When content was created
+            "source_type": self.SOURCE_TYPE,
+            "created_step": step,                    # When content was created
             "origin_id": self.unique_id,             # Original creator
             "spread_path": [self.unique_id],         # Tracks path through network
         }
@@ -134,26 +179,76 @@ class SocialMediaAgent(BaseAgent):
         # Implementation placeholder - logic will differ by social media account type
         return []
 
+    def _citizen_list(self) -> List[CitizenAgent]:
+        """
+        The model's citizens as an indexable list.
+
+        InformationFlowModel keeps a plain list of its citizens
+        (_citizens_list), which is used as is so broadcasts don't copy the
+        whole population each time; other models' citizens are copied once.
+        """
+        citizens = getattr(self.model, "_citizens_list", None)
+        return citizens if citizens is not None else list(self.model.citizens)
+
+    def _record_seed_nodes(
+        self, content: Dict[str, Any], recipients: List[CitizenAgent]
+    ) -> List[int]:
+        """Mark a small random subset of the initial recipients as seed nodes.
+
+        Seed nodes are stored in model.content_seed_nodes (keyed by content_id)
+        so that content propagation can be visualized from its starting points.
+
+        Args:
+            content: Content object being broadcast
+            recipients: Social media users who received the content directly
+
+        Returns:
+            Unique IDs of the recorded seed nodes (empty if none were recorded)
+        """
+        # Content without an ID (or a broadcast that reached nobody) has no
+        # seeds; check before any sizing or sampling work
+        content_id = content.get("content_id")
+        if not content_id or not recipients:
+            return []
+
+        # Limit number of seed nodes to avoid overcrowding the visualization
+        # Choose between 1-5 nodes, approximately 10% of recipients
+        max_seed_nodes = max(1, min(5, int(len(recipients) * 0.1)))
+        if len(recipients) > max_seed_nodes:
+            seed_indices = self.model.rng.choice(
+                len(recipients), size=max_seed_nodes, replace=False
+            )
+            seed_node_ids = [recipients[i].unique_id for i in seed_indices]
+        else:
+            seed_node_ids = [user.unique_id for user in recipients]
+
+        # Stored as a compact uint32 array; long runs accumulate one per content
+        self.model.content_seed_nodes[content_id] = array("I", seed_node_ids)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s %s: Marked %d seed nodes out of %d recipients",
+                self.SOURCE_TYPE, self.unique_id,
+                len(seed_node_ids), len(recipients),
+            )
+        return seed_node_ids
+
     def step(self):
         """Execute one step of the social media account agent."""
-        # Debug info about stepping process
-        print(
-            f"[DEBUG] SocialMediaAgent.step: {self.__class__.__name__} {self.unique_id} with publication_rate={self.publication_rate}"
-        )
-
         # Check if we should publish content this step
         content = self.publish_content()
 
         # If content was created, broadcast it
-        if content:
-            print(
-                f"[DEBUG] SocialMediaAgent.step: {self.__class__.__name__} {self.unique_id} created content, broadcasting..."
-            )
-            recipients = self.broadcast_content(content)
-            print(
-                f"[DEBUG] SocialMediaAgent.step: {self.__class__.__name__} {self.unique_id} broadcasted to {len(recipients)} social media users"
-            )
-        else:
-            print(
-                f"[DEBUG] SocialMediaAgent.step: {self.__class__.__name__} {self.unique_id} did not create content this step"
-            )
+        recipients = self.broadcast_content(content) if content else None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            if recipients is None:
+                logger.debug(
+                    "%s %s did not create content this step",
+                    self.SOURCE_TYPE, self.unique_id,
+                )
+            else:
+                logger.debug(
+                    "%s %s broadcasted to %d social media users",
+                    self.SOURCE_TYPE, self.unique_id, len(recipients),
+                )
@@ -16,6 +16,7 @@ Examples include traditional news organizations' social media accounts,
 mainstream media outlets, and established digital news publishers.
 """
 
+import logging
 from typing import Any, Dict, List, Optional
 
 import mesa
@@ -23,6 +24,9 @@ import mesa
 from infoflow.agents.base import CitizenAgent
 from infoflow.agents.media.base import SocialMediaAgent
 
+# Set up module-level logger
+logger = logging.getLogger("broadcast")
+
 
 class CorporateMediaAgent(SocialMediaAgent):
     """
@@ -88,15 +92,14 @@ class CorporateMediaAgent(SocialMediaAgent):
         Returns:
             List of citizens who received the content (whether accepted or not)
         """
-        import logging
-
-        logger = logging.getLogger("broadcast")
-        logger.debug(
-            f"[DEBUG] CorporateMediaAgent {self.unique_id}: Broadcasting content with accuracy={content.get('accuracy', 0.5):.4f}"
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"[DEBUG] CorporateMediaAgent {self.unique_id}: Broadcasting content with accuracy={content.get('accuracy', 0.5):.4f}"
+            )
 
         # Get all social media users from the model
-        users = getattr(self.model, "citizens", [])
+        users = self._citizen_list()
         if not users:
             logger.warning(
                 f"[WARNING] CorporateMediaAgent {self.unique_id}: No social media users found in model!"
@@ -105,56 +108,31 @@ class CorporateMediaAgent(SocialMediaAgent):
 
         # Determine how many users to reach based on influence_reach
         num_to_reach = int(len(users) * self.influence_reach)
-        logger.debug(
-            f"[DEBUG] CorporateMediaAgent {self.unique_id}: Trying to reach {num_to_reach} social media users out of {len(users)} (influence_reach={self.influence_reach:.2f})"
-        )
+        if debug:
+            logger.debug(
+                f"[DEBUG] CorporateMediaAgent {self.unique_id}: Trying to reach {num_to_reach} social media users out of {len(users)} (influence_reach={self.influence_reach:.2f})"
+            )
 
         # Select random social media users to reach
         if num_to_reach > 0:
-            # Use the model's random generator
-            indices = list(range(len(users)))
-            self.model.random.shuffle(indices)
-            selected_indices = indices[:num_to_reach]
+            # Sample without replacement using the model's numpy generator
+            # (partial sampling instead of shuffling every index)
+            selected_indices = self.model.rng.choice(
+                len(users), size=num_to_reach, replace=False
+            )
 
             selected_users = [users[i] for i in selected_indices]
 
-            # Count content acceptance
-            acceptance_count = 0
-
-            # Send content to selected social media users
             # Track seed nodes for this content - only the INITIAL recipients from media agent
-            # These users are the true "seed nodes" - first to receive the content
-            try:
-                if "content_id" in content:
-                    # Store seed nodes for this content
-                    if not hasattr(self.model, "content_seed_nodes"):
-                        self.model.content_seed_nodes = {}
-                    
-                    # Extract unique_ids safely - limit to 10% of users to avoid overcrowding
-                    max_seed_nodes = max(1, min(5, int(len(selected_users) * 0.1)))
-                    seed_indices = self.model.random.sample(range(len(selected_users)), max_seed_nodes) if len(selected_users) > max_seed_nodes else range(len(selected_users))
-                    
-                    seed_node_ids = []
-                    for idx in seed_indices:
-                        user = selected_users[idx]
-                        if hasattr(user, "unique_id"):
-                            seed_node_ids.append(user.unique_id)
-                    
-                    # Only store if we have valid seed nodes
-                    if seed_node_ids:
-                        self.model.content_seed_nodes[content["content_id"]] = seed_node_ids
-                        print(f"Corporate media: Marked {len(seed_node_ids)} seed nodes out of {len(selected_users)} recipients")
-            except Exception as e:
-                print(f"Error tracking seed nodes in corporate media: {e}")
-            
-            for user in selected_users:
-                accepted = user.receive_information(content, self)
-                if accepted:
-                    acceptance_count += 1
+            self._record_seed_nodes(content, selected_users)
 
-            logger.debug(
-                f"[DEBUG] CorporateMediaAgent {self.unique_id}: Content accepted by {acceptance_count} out of {len(selected_users)} social media users"
-            )
+            # Send content to selected social media users, counting acceptances
+            acceptance_count = CitizenAgent.broadcast_to(selected_users, content, self)
+
+            if debug:
+                logger.debug(
+                    f"[DEBUG] CorporateMediaAgent {self.unique_id}: Content accepted by {acceptance_count} out of {len(selected_users)} social media users"
+                )
             return selected_users
 
         return []
@@ -43,6 +43,23 @@ class GovernmentMediaAgent(SocialMediaAgent):
             publication_rate=publication_rate,
         )
 
+    def _update_truth_commitment_cache(self):
+        """Precompute base accuracy and the authority factor from truth commitment."""
+        super()._update_truth_commitment_cache()
+
+        # Calculate authority factor based on truth commitment
+        # Much more dramatic effect - low truth commitment severely reduces authority
+        truth_commitment = self._truth_commitment
+        if truth_commitment < 3.0:
+            # Very low authority for low truth commitment (0.5 to 0.8)
+            self._authority_scaling = 0.5 + (truth_commitment / 3.0) * 0.3
+        elif truth_commitment > 7.0:
+            # Very high authority for high truth commitment (1.2 to 1.5)
+            self._authority_scaling = 1.2 + (truth_commitment - 7.0) / 3.0 * 0.3
+        else:
+            # Progressive scaling in the middle (0.8 to 1.2)
+            self._authority_scaling = 0.8 + (truth_commitment - 3.0) / 4.0 * 0.4
+
     def create_content(self) -> Dict[str, Any]:
         """
         Create content with higher authority impact.
@@ -52,20 +69,7 @@ class GovernmentMediaAgent(SocialMediaAgent):
         when government communications are perceived as unreliable).
         """
         content = super().create_content()
-
-        # Calculate authority factor based on truth commitment
-        # Much more dramatic effect - low truth commitment severely reduces authority
-        if self.truth_commitment < 3.0:
-            # Very low authority for low truth commitment (0.5 to 0.8)
-            authority_scaling = 0.5 + (self.truth_commitment / 3.0) * 0.3
-        elif self.truth_commitment > 7.0:
-            # Very high authority for high truth commitment (1.2 to 1.5)
-            authority_scaling = 1.2 + (self.truth_commitment - 7.0) / 3.0 * 0.3
-        else:
-            # Progressive scaling in the middle (0.8 to 1.2)
-            authority_scaling = 0.8 + (self.truth_commitment - 3.0) / 4.0 * 0.4
-
-        content["authority_factor"] = authority_scaling
+        content["authority_factor"] = self._authority_scaling
 
         return content
 
@@ -82,7 +86,7 @@ class GovernmentMediaAgent(SocialMediaAgent):
             List of social media users who received the content
         """
         # Get all social media users from the model
-        users = getattr(self.model, "citizens", [])
+        users = self._citizen_list()
         if not users:
             return []
 
@@ -91,44 +95,19 @@ class GovernmentMediaAgent(SocialMediaAgent):
 
         # Select random social media users to reach
         if num_to_reach > 0:
-            # Use the model's random generator
-            indices = list(range(len(users)))
-            self.model.random.shuffle(indices)
-            selected_indices = indices[:num_to_reach]
+            # Sample without replacement using the model's numpy generator
+            # (partial sampling instead of shuffling every index)
+            selected_indices = self.model.rng.choice(
+                len(users), size=num_to_reach, replace=False
+            )
 
             selected_users = [users[i] for i in selected_indices]
 
             # Track seed nodes for this content - only select a small subset as true seed nodes
-            try:
-                if "content_id" in content:
-                    # Store seed nodes for this content
-                    if not hasattr(self.model, "content_seed_nodes"):
-                        self.model.content_seed_nodes = {}
-                    
-                    # Limit number of seed nodes to avoid overcrowding the visualization
-                    # Choose between 1-5 nodes, approximately 10% of recipients
-                    max_seed_nodes = max(1, min(5, int(len(selected_users) * 0.1)))
-                    
-                    # Randomly sample from selected users to get a smaller seed node set
-                    seed_indices = self.model.random.sample(range(len(selected_users)), max_seed_nodes) if len(selected_users) > max_seed_nodes else range(len(selected_users))
-                    
-                    # Extract unique_ids safely
-                    seed_node_ids = []
-                    for idx in seed_indices:
-                        user = selected_users[idx]
-                        if hasattr(user, "unique_id"):
-                            seed_node_ids.append(user.unique_id)
-                    
-                    # Only store if we have valid seed nodes
-                    if seed_node_ids:
-                        self.model.content_seed_nodes[content["content_id"]] = seed_node_ids
-                        print(f"Government media: Marked {len(seed_node_ids)} seed nodes out of {len(selected_users)} recipients")
-            except Exception as e:
-                print(f"Error tracking seed nodes in government media: {e}")
-            
+            self._record_seed_nodes(content, selected_users)
+
             # Send content to selected social media users
-            for user in selected_users:
-                user.receive_information(content, self)
+            CitizenAgent.broadcast_to(selected_users, content, self)
 
             return selected_users
 
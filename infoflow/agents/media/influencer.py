@@ -5,6 +5,7 @@ This module defines the social media influencer account type, representing indiv
 with dedicated follower networks and high engagement on social platforms.
 """
 
+import weakref
 from typing import Any, Dict, List, Optional
 
 import mesa
@@ -13,6 +14,21 @@ from infoflow.agents.base import CitizenAgent
 from infoflow.agents.media.base import SocialMediaAgent
 
 
+def _sample_k(seq, k: int, rng) -> list:
+    """
+    Draw k distinct items from a sequence without modifying it.
+
+    Args:
+        seq: Sequence to sample from
+        k: Number of items to draw
+        rng: random.Random-compatible generator (e.g. a Mesa model's random)
+
+    Returns:
+        A list of k items, or an empty list if k is not in 1..len(seq)
+    """
+    return rng.sample(seq, k) if 0 < k <= len(seq) else []
+
+
 class InfluencerAgent(SocialMediaAgent):
     """
     Social media influencers with dedicated follower networks.
@@ -44,17 +60,69 @@ class InfluencerAgent(SocialMediaAgent):
             publication_rate=publication_rate,
         )
         self.engagement_factor = engagement_factor
-        self.followers = []  # Social media users who follow this influencer
+        # Social media users who follow this influencer, held weakly so agents
+        # removed from the model aren't kept alive. Used as an ordered weak set:
+        # keys keep the follow order (delivery order depends on it) and give
+        # O(1) membership tests.
+        self._followers = weakref.WeakKeyDictionary()
+
+    @property
+    def influence_reach(self) -> float:
+        """
+        Proportion of social media users reached (0-1 scale).
+
+        Overrides the plain influence_reach attribute of SocialMediaAgent:
+        SocialMediaAgent.__init__ assigns it through this setter, which keeps
+        _half_reach (the non-follower reach used by broadcast_content) in
+        sync whenever the reach changes.
+        """
+        return self._influence_reach
+
+    @influence_reach.setter
+    def influence_reach(self, value: float):
+        self._influence_reach = value
+        # Non-followers are reached at half the nominal rate; cache the factor
+        # so each broadcast does a single multiply
+        self._half_reach = value * 0.5
+
+    @property
+    def followers(self) -> List[CitizenAgent]:
+        """Snapshot of this influencer's followers, in follow order."""
+        return list(self._followers)
 
     def add_follower(self, user: CitizenAgent):
         """Add a social media user to this influencer's follower network."""
-        if user not in self.followers:
-            self.followers.append(user)
+        self._followers.setdefault(user)
 
     def remove_follower(self, user: CitizenAgent):
         """Remove a social media user from this influencer's follower network."""
-        if user in self.followers:
-            self.followers.remove(user)
+        self._followers.pop(user, None)
+
+    def _sample_non_followers(self, users, k: int) -> List[CitizenAgent]:
+        """Draw k distinct citizens from users that don't follow this influencer.
+
+        While followers are a minority, this rejection-samples indices into
+        users so the non-follower list is never built; otherwise most draws
+        would be rejected and the list is filtered instead.
+
+        Rejection sampling only runs when k <= len(users) - len(followers),
+        which guarantees at least k non-followers in users (whether or not
+        every follower is in users), so the loop always finishes. Larger k
+        goes through the filter, which returns nothing if k can't be met.
+        """
+        follower_set = self._followers
+        rng = self.model.random
+        num_followers = len(follower_set)
+        if num_followers * 2 > len(users) or k > len(users) - num_followers:
+            return _sample_k([u for u in users if u not in follower_set], k, rng)
+
+        # Dict keys keep the draw order and reject repeated indices in O(1)
+        picked = {}
+        while len(picked) < k:
+            for idx in rng.sample(range(len(users)), k - len(picked)):
+                if idx not in picked and users[idx] not in follower_set:
+                    picked[idx] = None
+        return [users[idx] for idx in picked]
 
     def create_content(self) -> Dict[str, Any]:
         """
@@ -77,60 +145,30 @@ class InfluencerAgent(SocialMediaAgent):
         Returns:
             List of social media users who received the content
         """
-        # If we have dedicated followers, send to them
-        reached_users = []
-        if self.followers:
-            for follower in self.followers:
-                follower.receive_information(content, self)
-                reached_users.append(follower)
-
-        # Also reach some non-followers based on influence_reach
-        users = getattr(self.model, "citizens", [])
-        if users:
-            # Filter out followers to avoid duplicates
-            non_followers = [u for u in users if u not in self.followers]
-            if non_followers:
-                # Reach a percentage of non-followers based on influence_reach
-                num_to_reach = int(len(non_followers) * (self.influence_reach / 2))
-                if num_to_reach > 0:
-                    # Use the model's random generator
-                    indices = list(range(len(non_followers)))
-                    self.model.random.shuffle(indices)
-                    selected_indices = indices[:num_to_reach]
-
-                    selected_users = [non_followers[i] for i in selected_indices]
-
-                    for user in selected_users:
-                        user.receive_information(content, self)
-
-                    reached_users.extend(selected_users)
-        
-        # Track seed nodes for this content - only select a small subset as seeds
-        try:
-            if "content_id" in content and reached_users:
-                # Store seed nodes for this content
-                if not hasattr(self.model, "content_seed_nodes"):
-                    self.model.content_seed_nodes = {}
-                
-                # Select only a small subset of users as seed nodes (limited to max 5 and min 1)
-                max_seed_nodes = max(1, min(5, int(len(reached_users) * 0.1)))
-                
-                # Create a copy of the list to avoid modifying the original
-                potential_seeds = list(reached_users)
-                self.model.random.shuffle(potential_seeds)
-                selected_seeds = potential_seeds[:max_seed_nodes]
-                
-                # Extract unique_ids safely
-                seed_node_ids = []
-                for user in selected_seeds:
-                    if hasattr(user, "unique_id"):
-                        seed_node_ids.append(user.unique_id)
-                
-                # Only store if we have valid seed nodes
-                if seed_node_ids:
-                    self.model.content_seed_nodes[content["content_id"]] = seed_node_ids
-                    print(f"Influencer: Marked {len(seed_node_ids)} seed nodes out of {len(reached_users)} recipients")
-        except Exception as e:
-            print(f"Error tracking seed nodes in influencer media: {e}")
+        # If we have dedicated followers, send to them (snapshotted once, as
+        # the weak follower set may shrink while we iterate)
+        followers = self.followers
+        CitizenAgent.broadcast_to(followers, content, self)
+
+        # Also reach some non-followers (excluded to avoid duplicates) at half
+        # the nominal influence_reach. Followers are drawn from the citizens,
+        # so the non-followers number len(users) - len(followers) with no scan
+        # needed; _sample_non_followers stays safe if that ever stops holding.
+        users = self._citizen_list()
+        num_to_reach = int((len(users) - len(followers)) * self._half_reach)
+        selected_users = (
+            self._sample_non_followers(users, num_to_reach) if num_to_reach > 0 else []
+        )
+        CitizenAgent.broadcast_to(selected_users, content, self)
+
+        # Nobody reached (no followers, nobody else in range): no seeds to track
+        if not followers and not selected_users:
+            return []
+
+        # Everyone reached, followers first, built in a single allocation
+        reached_users = [*followers, *selected_users]
+
+        # Track a few of the initial recipients as seed nodes
+        self._record_seed_nodes(content, reached_users)
 
         return reached_users
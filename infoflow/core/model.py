@@ -14,13 +14,20 @@ The simulation focuses on:
 
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import mesa
 import networkx as nx
 import numpy as np
 
-from infoflow.agents.base import CitizenAgent, SocialMediaAgent, AgentSet
+from infoflow.agents.base import (
+    MEDIA_SOURCE_TYPES,
+    AgentSet,
+    CitizenAgent,
+    SocialMediaAgent,
+    get_media_trust,
+)
 from infoflow.agents.media.corporate import CorporateMediaAgent
 from infoflow.agents.media.government import GovernmentMediaAgent
 from infoflow.agents.media.influencer import InfluencerAgent
@@ -30,6 +37,52 @@ from infoflow.utils.simple_stats import StatsCollector
 # Set up module-level logger
 logger = logging.getLogger("infoflow.model")
 
+# Per-citizen fields recorded in each step's agent snapshot; the trust fields
+# follow the order of MEDIA_SOURCE_TYPES
+SNAPSHOT_FIELDS = (
+    "truth_assessment",
+    "trust_corporate",
+    "trust_influencer",
+    "trust_government",
+    "confirmation_bias",
+    "critical_thinking",
+    "social_conformity",
+    "truth_seeking",
+)
+
+# Per-citizen fields gathered into InformationFlowModel.citizen_state arrays;
+# the trust fields follow the order of MEDIA_SOURCE_TYPES
+CITIZEN_STATE_FIELDS = (
+    "truth_assessment",
+    "trust_corporate",
+    "trust_influencer",
+    "trust_government",
+)
+
+
+def _fill_rows(rows: Iterable[Tuple[float, ...]], num_rows: int, width: int) -> np.ndarray:
+    """
+    Build a (num_rows, width) float array from an iterable of row tuples.
+
+    np.fromiter with an exact count writes the values straight into a
+    preallocated buffer, without materializing the rows as a list first.
+    """
+    values = chain.from_iterable(rows)
+    return np.fromiter(values, dtype=float, count=num_rows * width).reshape(num_rows, width)
+
+
+def _pearson(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Pearson correlation of two equal-length arrays.
+
+    Computes the single coefficient directly instead of np.corrcoef's full
+    2x2 matrix, and returns 0.0 when either array is constant.
+    """
+    a = a - a.mean()
+    b = b - b.mean()
+    denominator = np.sqrt(np.dot(a, a) * np.dot(b, b))
+    return 0.0 if denominator == 0 else float(np.dot(a, b) / denominator)
+
 
 class InformationFlowModel(mesa.Model):
     """
@@ -75,6 +128,9 @@ class InformationFlowModel(mesa.Model):
         network_type: str = "small_world",
         network_params: Optional[Dict] = None,
         seed: Optional[int] = None,
+        collect_every: int = 1,
+        simplified: bool = False,
+        verbose: bool = False,
     ):
         """
         Initialize the model with the given parameters.
@@ -102,19 +158,69 @@ class InformationFlowModel(mesa.Model):
                 - "random": Random connections between agents
             network_params: Parameters for network creation (specific to network type)
             seed: Random seed for reproducibility
+            collect_every: Run the DataCollector only every this many steps
+                (the initial state is always collected); must be an int >= 1.
+                reporter_values and citizen_state are only refreshed on
+                collection steps, so they are stale in between.
+            simplified: Create exactly one agent of each media type, ignoring
+                the num_* media counts. Only one agent per type ever publishes,
+                so the extra media agents only add setup cost.
+            verbose: Print the duplicate-prevention and content summary after
+                every step
         """
+        if (
+            not isinstance(collect_every, int)
+            or isinstance(collect_every, bool)
+            or collect_every < 1
+        ):
+            raise ValueError(
+                f"collect_every must be a positive integer, got {collect_every!r}"
+            )
+
         # Important: Call the superclass constructor with the seed
         super().__init__(seed=seed)
 
         # Store parameters
+        if simplified:
+            num_corporate_media = num_influencers = num_government = 1
+        self.simplified = simplified
         self.num_citizens = num_citizens
         self.num_corporate_media = num_corporate_media
         self.num_influencers = num_influencers
         self.num_government = num_government
         self.network_type = network_type
+        self.collect_every = collect_every
+        self.verbose = verbose
         
-        # Initialize storage for individual agent tracking
-        self.agent_snapshots = {}
+        # Initialize storage for individual agent tracking: one array of
+        # SNAPSHOT_FIELDS values per step, rows in _snapshot_ids order
+        self._snapshots = {}
+        self._snapshot_ids = None
+
+        # Central content tracking shared by all agents (single copy per content)
+        self.content_tracker = {}
+        self.content_seed_nodes = {}
+        self.duplicate_prevention_stats = {
+            "duplicates_prevented": 0,
+            "successful_shares": 0,
+        }
+
+        # Content control flags to limit content to one per media type
+        # This enables the "three pieces total" simplified model
+        self.content_control = {
+            "CorporateMediaAgent": {
+                "has_published": False,
+                "representative_published": False,
+            },
+            "InfluencerAgent": {
+                "has_published": False,
+                "representative_published": False,
+            },
+            "GovernmentMediaAgent": {
+                "has_published": False,
+                "representative_published": False,
+            },
+        }
 
         # Create a model-specific StatsCollector that won't conflict with the web interface collector
         # This is for internal use only and is completely separate from the collector used for export
@@ -157,6 +263,14 @@ class InformationFlowModel(mesa.Model):
         self.G = self._create_network()
         self.grid = mesa.space.NetworkGrid(self.G)
 
+        # The topology is fixed after setup, so freeze it into CSR arrays:
+        # node i's neighbors are _nbr_idx[_nbr_indptr[i]:_nbr_indptr[i + 1]]
+        adjacency = nx.to_scipy_sparse_array(
+            self.G, nodelist=range(self.num_citizens), format="csr"
+        )
+        self._nbr_indptr = adjacency.indptr
+        self._nbr_idx = adjacency.indices
+
         # Create agents
         self._create_citizen_agents()
         self._create_media_agents()
@@ -164,64 +278,63 @@ class InformationFlowModel(mesa.Model):
         # Create agent sets for easy management
         # AgentSet is imported via infoflow.agents.base where we handle the compatibility
 
-        # Print debug information about all agents in the model
-        print(f"Model has {len(self.agents)} agents total")
-        citizen_count = sum(1 for a in self.agents if isinstance(a, CitizenAgent))
-        corporate_count = sum(
-            1 for a in self.agents if isinstance(a, CorporateMediaAgent)
-        )
-        influencer_count = sum(1 for a in self.agents if isinstance(a, InfluencerAgent))
-        government_count = sum(
-            1 for a in self.agents if isinstance(a, GovernmentMediaAgent)
-        )
-        print(
-            f"Agent counts: {citizen_count} citizens, {corporate_count} corporate, {influencer_count} influencers, {government_count} government"
+        # Partition all agents by class in a single pass
+        buckets = {
+            CitizenAgent: [],
+            CorporateMediaAgent: [],
+            InfluencerAgent: [],
+            GovernmentMediaAgent: [],
+        }
+        for agent in self.agents:
+            buckets.setdefault(type(agent), []).append(agent)
+
+        # Log debug information about all agents in the model
+        logger.debug(
+            "Model has %d agents total: %d citizens, %d corporate, %d influencers, %d government",
+            len(self.agents),
+            len(buckets[CitizenAgent]),
+            len(buckets[CorporateMediaAgent]),
+            len(buckets[InfluencerAgent]),
+            len(buckets[GovernmentMediaAgent]),
         )
 
-        # Create set of all citizens
-        self.citizens = AgentSet(
-            [a for a in self.agents if isinstance(a, CitizenAgent)], random=self.random
-        )
+        # Create set of all citizens. The AgentSet is kept for (shuffled)
+        # activation via citizens.do(); read-only passes over the citizens
+        # iterate the plain list directly.
+        self._citizens_list = buckets[CitizenAgent]
+        self.citizens = AgentSet(self._citizens_list, random=self.random)
 
         # Create sets for different media types
         self.corporate_medias = AgentSet(
-            [a for a in self.agents if isinstance(a, CorporateMediaAgent)],
-            random=self.random,
-        )
-
-        self.influencers = AgentSet(
-            [a for a in self.agents if isinstance(a, InfluencerAgent)],
-            random=self.random,
+            buckets[CorporateMediaAgent], random=self.random
         )
-
+        self.influencers = AgentSet(buckets[InfluencerAgent], random=self.random)
         self.government_medias = AgentSet(
-            [a for a in self.agents if isinstance(a, GovernmentMediaAgent)],
-            random=self.random,
-        )
-
-        # Create combined set of all media agents - IMPORTANT BUG FIX
-        # The issue is that we're using isinstance(), but the agents might not actually be
-        # instances of SocialMediaAgent due to Mesa 3's way of dynamically creating agent classes
-        # So instead we'll check for 'publication_rate' attribute which only media agents have
-
-        # First log the actual agents to see what they are
-        media_count = sum(1 for a in self.agents if hasattr(a, "publication_rate"))
-        print(
-            f"Found {media_count} agents with publication_rate attribute (media agents)"
+            buckets[GovernmentMediaAgent], random=self.random
         )
 
-        # Create the combined set of all media agents
+        # Create combined set of all media agents, built from the exact-class
+        # buckets so no attribute probing is needed to tell media apart
         self.media_agents = AgentSet(
-            [a for a in self.agents if hasattr(a, "publication_rate")],
+            buckets[CorporateMediaAgent]
+            + buckets[InfluencerAgent]
+            + buckets[GovernmentMediaAgent],
             random=self.random,
         )
 
-        # Log the corrected agent count
-        print(f"Created media_agents AgentSet with {len(self.media_agents)} agents")
-
-        # Print debug information about agent sets
-        print(
-            f"Created agent sets: {len(self.citizens)} citizens, {len(self.corporate_medias)} corporate, {len(self.influencers)} influencers, {len(self.government_medias)} government, {len(self.media_agents)} total media"
+        # The one agent per media type that will publish its content
+        self._media_reps = self._choose_media_representatives()
+        # Set once every media type has published its one piece of content
+        self._all_published = False
+
+        # Log debug information about agent sets
+        logger.debug(
+            "Created agent sets: %d citizens, %d corporate, %d influencers, %d government, %d total media",
+            len(self.citizens),
+            len(self.corporate_medias),
+            len(self.influencers),
+            len(self.government_medias),
+            len(self.media_agents),
         )
 
         # Setup data collection
@@ -231,6 +344,30 @@ class InformationFlowModel(mesa.Model):
         # We'll keep the StatsCollector in memory for model-specific use, but won't write to the DB
         # self.stats.start_run(self._get_parameters_dict())  <- IMPORTANT: Commented out to avoid duplicate runs
 
+    def _choose_media_representatives(self) -> List[Tuple[str, SocialMediaAgent]]:
+        """
+        Choose the one agent per media type that publishes that type's content.
+
+        Only one agent per media type ever publishes, and media agents never
+        change during a run, so the representatives are picked once at setup
+        rather than by grouping the media agents on every step. Types with no
+        agents are left out.
+
+        Returns:
+            List of (media type name, representative agent) pairs, with type
+            names keyed like content_control
+        """
+        groups = (
+            ("CorporateMediaAgent", list(self.corporate_medias)),
+            ("InfluencerAgent", list(self.influencers)),
+            ("GovernmentMediaAgent", list(self.government_medias)),
+        )
+        return [
+            (agent_type, self.random.choice(agents))
+            for agent_type, agents in groups
+            if agents
+        ]
+
     def _create_network(self) -> nx.Graph:
         """
         Create a network of the specified type.
@@ -239,37 +376,55 @@ class InformationFlowModel(mesa.Model):
             A networkx graph object
         """
         # Use the dedicated network creation utility
-        return create_network(
+        G = create_network(
             network_type=self.network_type,
             num_nodes=self.num_citizens,
             params=self.network_params,
             seed=self.random.randint(0, 10000),
         )
 
+        # Citizens are placed one per node and the CSR neighbor arrays and
+        # node_citizens table are indexed by node, so nodes must be 0..N-1 in
+        # order; the built-in generators already are, so this is a no-op check
+        if list(G) != list(range(self.num_citizens)):
+            G = nx.convert_node_labels_to_integers(G, ordering="sorted")
+        return G
+
     def _create_citizen_agents(self):
         """Create and place citizen agents in the network."""
-        for i in range(self.num_citizens):
+        # Draw every citizen's randomized properties up front, one vectorized
+        # call per property on the model's seeded numpy generator
+        n = self.num_citizens
+        params = self.citizen_params
+        truth_assessments = self.rng.random(n).tolist()
+        truth_seeking = self.rng.normal(
+            params["truth_seeking_mean"], params["truth_seeking_std"], n
+        ).tolist()
+        confirmation_bias = self.rng.uniform(
+            params["confirmation_bias_min"], params["confirmation_bias_max"], n
+        ).tolist()
+        critical_thinking = self.rng.uniform(
+            params["critical_thinking_min"], params["critical_thinking_max"], n
+        ).tolist()
+        social_conformity = self.rng.uniform(
+            params["social_conformity_min"], params["social_conformity_max"], n
+        ).tolist()
+        influence = self.rng.uniform(1, 10, n).tolist()  # Random influence
+
+        # Citizen at each network node, indexed by node ID; a flat lookup
+        # table standing in for per-node grid queries
+        self.node_citizens = [None] * n
+
+        for i in range(n):
             # Create citizen with randomized properties
             agent = CitizenAgent(
                 model=self,
-                initial_truth_assessment=self.random.random(),  # Random truth assessment between 0-1
-                truth_seeking=self.random.gauss(
-                    self.citizen_params["truth_seeking_mean"],
-                    self.citizen_params["truth_seeking_std"],
-                ),
-                confirmation_bias=self.random.uniform(
-                    self.citizen_params["confirmation_bias_min"],
-                    self.citizen_params["confirmation_bias_max"],
-                ),
-                critical_thinking=self.random.uniform(
-                    self.citizen_params["critical_thinking_min"],
-                    self.citizen_params["critical_thinking_max"],
-                ),
-                social_conformity=self.random.uniform(
-                    self.citizen_params["social_conformity_min"],
-                    self.citizen_params["social_conformity_max"],
-                ),
-                influence=self.random.uniform(1, 10),  # Random influence
+                initial_truth_assessment=truth_assessments[i],  # Between 0-1
+                truth_seeking=truth_seeking[i],
+                confirmation_bias=confirmation_bias[i],
+                critical_thinking=critical_thinking[i],
+                social_conformity=social_conformity[i],
+                influence=influence[i],
             )
 
             # Set initial trust levels if provided
@@ -290,15 +445,15 @@ class InformationFlowModel(mesa.Model):
 
             # Place agent in the network at node i
             self.grid.place_agent(agent, i)
+            self.node_citizens[i] = agent
 
     def _create_media_agents(self):
         """Create media agents of different types."""
         # Create corporate media agents
-        for i in range(self.num_corporate_media):
-            # Generate political bias within the specified range
-            bias_min, bias_max = self.media_params["corporate_bias_range"]
-            bias = self.random.uniform(bias_min, bias_max)
-
+        # Generate political biases within the specified range
+        bias_min, bias_max = self.media_params["corporate_bias_range"]
+        biases = self.rng.uniform(bias_min, bias_max, self.num_corporate_media)
+        for bias in biases.tolist():
             agent = CorporateMediaAgent(
                 model=self,
                 political_bias=bias,
@@ -313,11 +468,10 @@ class InformationFlowModel(mesa.Model):
             # Mesa 3 already adds the agent to model.agents
 
         # Create influencer agents
-        for i in range(self.num_influencers):
-            # Generate political bias within the specified range
-            bias_min, bias_max = self.media_params["influencer_bias_range"]
-            bias = self.random.uniform(bias_min, bias_max)
-
+        # Generate political biases within the specified range
+        bias_min, bias_max = self.media_params["influencer_bias_range"]
+        biases = self.rng.uniform(bias_min, bias_max, self.num_influencers)
+        for bias in biases.tolist():
             agent = InfluencerAgent(
                 model=self,
                 political_bias=bias,
@@ -353,9 +507,12 @@ class InformationFlowModel(mesa.Model):
         # No need to place media agents on the network grid - they're not spatial
 
         # Debug message about agent creation
-        print(f"Created {self.num_corporate_media} corporate media agents")
-        print(f"Created {self.num_influencers} influencer agents")
-        print(f"Created {self.num_government} government media agents")
+        logger.debug(
+            "Created %d corporate media, %d influencer and %d government media agents",
+            self.num_corporate_media,
+            self.num_influencers,
+            self.num_government,
+        )
 
     def _setup_data_collection(self):
         """Set up data collection for the model."""
@@ -367,60 +524,23 @@ class InformationFlowModel(mesa.Model):
         }
 
         # Calculate initial average trust values
+        self._refresh_citizen_state()
         if hasattr(self, "citizens") and self.citizens:
             self.initial_trust = {
-                "CorporateMediaAgent": np.mean(
-                    [
-                        a.trust_levels.get("CorporateMediaAgent", 5.0)
-                        for a in self.citizens
-                    ]
-                ),
-                "InfluencerAgent": np.mean(
-                    [a.trust_levels.get("InfluencerAgent", 5.0) for a in self.citizens]
-                ),
+                "CorporateMediaAgent": np.mean(self.citizen_state["trust_corporate"]),
+                "InfluencerAgent": np.mean(self.citizen_state["trust_influencer"]),
                 "GovernmentMediaAgent": np.mean(
-                    [
-                        a.trust_levels.get("GovernmentMediaAgent", 5.0)
-                        for a in self.citizens
-                    ]
+                    self.citizen_state["trust_government"]
                 ),
             }
 
         # Setup data collector with additional metrics
         self.datacollector = mesa.DataCollector(
-            # Model-level metrics
+            # Model-level metrics (including trust variance to show polarization),
+            # all computed together by _refresh_citizen_state
             model_reporters={
-                "Average Truth Assessment": lambda m: np.mean(
-                    [a.truth_assessment for a in m.citizens]
-                ),
-                "Truth Assessment Variance": lambda m: np.var(
-                    [a.truth_assessment for a in m.citizens]
-                ),
-                "Trust in Corporate Media": lambda m: np.mean(
-                    [a.trust_levels.get("CorporateMediaAgent", 5.0) for a in m.citizens]
-                ),
-                "Trust in Influencers": lambda m: np.mean(
-                    [a.trust_levels.get("InfluencerAgent", 5.0) for a in m.citizens]
-                ),
-                "Trust in Government": lambda m: np.mean(
-                    [
-                        a.trust_levels.get("GovernmentMediaAgent", 5.0)
-                        for a in m.citizens
-                    ]
-                ),
-                # Add trust variance metrics to show polarization
-                "Trust Variance - Corporate": lambda m: np.var(
-                    [a.trust_levels.get("CorporateMediaAgent", 5.0) for a in m.citizens]
-                ),
-                "Trust Variance - Government": lambda m: np.var(
-                    [
-                        a.trust_levels.get("GovernmentMediaAgent", 5.0)
-                        for a in m.citizens
-                    ]
-                ),
-                "Trust Variance - Influencers": lambda m: np.var(
-                    [a.trust_levels.get("InfluencerAgent", 5.0) for a in m.citizens]
-                ),
+                name: (lambda m, name=name: m.reporter_values[name])
+                for name in self.reporter_values
             },
             # Agent-level metrics - only collect these for citizen agents
             agent_reporters={
@@ -448,6 +568,54 @@ class InformationFlowModel(mesa.Model):
         # Collect initial data
         self.datacollector.collect(self)
 
+    def _gather_citizen_state(self) -> np.ndarray:
+        """
+        Read every citizen's CITIZEN_STATE_FIELDS values in a single pass.
+
+        Returns:
+            Array of shape (len(CITIZEN_STATE_FIELDS), num_citizens), one
+            contiguous row per field
+        """
+        citizens = self._citizens_list
+        rows = (
+            (a.truth_assessment, *get_media_trust(a.trust_levels))
+            for a in citizens
+        )
+        return np.ascontiguousarray(
+            _fill_rows(rows, len(citizens), len(CITIZEN_STATE_FIELDS)).T
+        )
+
+    def _refresh_citizen_state(self):
+        """
+        Gather citizen state arrays and the model-level statistics over them.
+
+        Citizens remain the source of truth; this builds a structure-of-arrays
+        view of them in a single pass (model.citizen_state, one array per field
+        in CITIZEN_STATE_FIELDS) and then computes every model reporter value
+        with one mean and one variance reduction over all fields at once
+        (model.reporter_values), so the DataCollector's reporters are lookups.
+
+        Only called on collection steps, so with collect_every > 1 both
+        attributes describe the last collected step, not the current one.
+        """
+        columns = self._gather_citizen_state()
+        self.citizen_state = dict(zip(CITIZEN_STATE_FIELDS, columns))
+        # Lets _record_stats reuse this gather on collection steps
+        self._citizen_columns = (self.steps, columns)
+
+        means = dict(zip(CITIZEN_STATE_FIELDS, columns.mean(axis=1)))
+        variances = dict(zip(CITIZEN_STATE_FIELDS, columns.var(axis=1)))
+        self.reporter_values = {
+            "Average Truth Assessment": means["truth_assessment"],
+            "Truth Assessment Variance": variances["truth_assessment"],
+            "Trust in Corporate Media": means["trust_corporate"],
+            "Trust in Influencers": means["trust_influencer"],
+            "Trust in Government": means["trust_government"],
+            "Trust Variance - Corporate": variances["trust_corporate"],
+            "Trust Variance - Government": variances["trust_government"],
+            "Trust Variance - Influencers": variances["trust_influencer"],
+        }
+
     def _get_parameters_dict(self):
         """
         Get a dictionary of all model parameters for stats collection.
@@ -479,24 +647,26 @@ class InformationFlowModel(mesa.Model):
 
     def _connect_citizens(self):
         """Connect citizen agents based on the network structure."""
-        # For each citizen, set their neighbors based on the network
-        for i, citizen in enumerate(self.citizens):
+        # For each citizen, set their neighbors based on the network. The
+        # topology is fixed after setup, so neighbors are resolved once from
+        # the CSR arrays and stored as an immutable tuple that step() can
+        # iterate directly.
+        node_citizens = self.node_citizens
+        indptr = self._nbr_indptr.tolist()
+        indices = self._nbr_idx.tolist()
+        for citizen in self._citizens_list:
             # Use the agent's position in the network
-            node_id = i  # We placed citizens at positions 0 to num_citizens-1
-            neighbor_nodes = list(self.G.neighbors(node_id))
-
-            # Get the agents at those positions
-            citizen.neighbors = []
-            for node in neighbor_nodes:
-                agents_at_node = self.grid.get_cell_list_contents([node])
-                citizen_agents = [
-                    a for a in agents_at_node if isinstance(a, CitizenAgent)
-                ]
-                citizen.neighbors.extend(citizen_agents)
+            node = citizen.pos
+            citizen.neighbors = tuple(
+                node_citizens[j]
+                for j in indices[indptr[node] : indptr[node + 1]]
+                if node_citizens[j] is not None
+            )
 
     def _connect_influencers_to_followers(self):
         """Connect influencer agents to random followers."""
         # Each influencer gets some followers from the citizen population
+        citizens = self._citizens_list
         for influencer in self.influencers:
             # Determine number of followers (between 5-20% of citizens)
             num_followers = self.random.randint(
@@ -504,14 +674,17 @@ class InformationFlowModel(mesa.Model):
                 max(2, int(self.num_citizens * 0.2)),
             )
 
-            # Select random citizens as followers
-            potential_followers = list(self.citizens)
-            self.random.shuffle(potential_followers)
-            followers = potential_followers[:num_followers]
+            # Select random citizens as followers; drawing indices avoids
+            # copying and shuffling the whole population per influencer.
+            # The draw uses the numpy generator (self.rng), which is seeded
+            # from the same model seed as self.random but yields a different
+            # follower set for a given seed than the old shuffle did.
+            num_followers = min(num_followers, len(citizens))
+            follower_idx = self.rng.choice(len(citizens), size=num_followers, replace=False)
 
             # Add citizens as followers
-            for citizen in followers:
-                influencer.add_follower(citizen)
+            for i in follower_idx:
+                influencer.add_follower(citizens[i])
 
     def setup_connections(self):
         """Set up all network connections after agents are created."""
@@ -522,23 +695,62 @@ class InformationFlowModel(mesa.Model):
         self._connect_influencers_to_followers()
 
     def _store_agent_snapshots(self):
-        """Store snapshots of citizen agents for individual tracking."""
-        snapshot = {}
-        
-        for agent in self.citizens:
-            # Store relevant agent properties for tracking
-            snapshot[agent.unique_id] = {
-                'truth_assessment': agent.truth_assessment,
-                'trust_levels': {k: v for k, v in agent.trust_levels.items()},
-                'confirmation_bias': agent.confirmation_bias,
-                'critical_thinking': agent.critical_thinking,
-                'social_conformity': agent.social_conformity,
-                'truth_seeking': agent.truth_seeking,
-            }
-        
-        # Store the snapshot for this step
-        self.agent_snapshots[self.steps] = snapshot
-    
+        """
+        Store snapshots of citizen agents for individual tracking.
+
+        Each step's snapshot is a single (citizens x SNAPSHOT_FIELDS) array
+        instead of a dict per citizen; agent_snapshots rebuilds the nested
+        dict form on demand. The citizen population is fixed after setup, so
+        the row order (citizen IDs) is recorded once.
+        """
+        citizens = self._citizens_list
+        if self._snapshot_ids is None:
+            self._snapshot_ids = [a.unique_id for a in citizens]
+
+        rows = (
+            (
+                a.truth_assessment,
+                *get_media_trust(a.trust_levels),
+                a.confirmation_bias,
+                a.critical_thinking,
+                a.social_conformity,
+                a.truth_seeking,
+            )
+            for a in citizens
+        )
+        self._snapshots[self.steps] = _fill_rows(rows, len(citizens), len(SNAPSHOT_FIELDS))
+
+    @property
+    def agent_snapshots(self) -> Dict[int, Dict[int, Dict[str, Any]]]:
+        """
+        Citizen snapshots for every recorded step.
+
+        The nested dicts are decoded from the per-step arrays on every access
+        and not kept, so each call returns a new dictionary the caller owns.
+        Read it once per export; code that only needs the values should use
+        the arrays instead (as DataCollector does).
+
+        Returns:
+            Dictionary mapping step -> citizen unique_id -> snapshot dict with
+            truth_assessment, trust_levels (keyed by the three media types only),
+            confirmation_bias, critical_thinking, social_conformity and
+            truth_seeking
+        """
+        snapshots = {}
+        for step, values in self._snapshots.items():
+            snapshot = {}
+            for agent_id, row in zip(self._snapshot_ids, values.tolist()):
+                snapshot[agent_id] = {
+                    "truth_assessment": row[0],
+                    "trust_levels": dict(zip(MEDIA_SOURCE_TYPES, row[1:4])),
+                    "confirmation_bias": row[4],
+                    "critical_thinking": row[5],
+                    "social_conformity": row[6],
+                    "truth_seeking": row[7],
+                }
+            snapshots[step] = snapshot
+        return snapshots
+
     def step(self):
         """
         Execute one step of the model simulation.
@@ -553,314 +765,217 @@ class InformationFlowModel(mesa.Model):
         Each step represents a discrete time interval in the simulation where
         all agents perform their actions once.
         """
-        print(
-            f"\nExecuting model step {self.steps} with {len(self.media_agents)} media agents and {len(self.citizens)} citizens"
+        logger.debug(
+            "Executing model step %d with %d media agents and %d citizens",
+            self.steps,
+            len(self.media_agents),
+            len(self.citizens),
         )
         
-        # Initialize content tracker if not already present
-        if not hasattr(self, "content_tracker"):
-            self.content_tracker = {}
-            print("Initialized content_tracker in model")
-            
-        # Initialize duplicate prevention statistics
-        if not hasattr(self, "duplicate_prevention_stats"):
-            self.duplicate_prevention_stats = {
-                "duplicates_prevented": 0,
-                "successful_shares": 0
-            }
-            print("Initialized duplicate prevention statistics")
-            
-        # Initialize content control flags to limit content to one per media type
-        # This enables the "three pieces total" simplified model
-        if not hasattr(self, "content_control"):
-            self.content_control = {
-                "CorporateMediaAgent": {
-                    "has_published": False,
-                    "representative_published": False
-                },
-                "InfluencerAgent": {
-                    "has_published": False, 
-                    "representative_published": False
-                },
-                "GovernmentMediaAgent": {
-                    "has_published": False,
-                    "representative_published": False
-                }
-            }
-            print("Initialized content control flags - limiting to one piece per media type")
-
-        # Verify media agents are set up correctly
+        # Media agents are partitioned by exact class at setup, so an empty
+        # set means the run simply has none; there is nothing to re-probe
         if len(self.media_agents) == 0:
-            print("ERROR: No media agents found!")
-            # Just log the model state for debugging
-            media_count = sum(1 for a in self.agents if hasattr(a, "publication_rate"))
-            print(f"Found {media_count} agents with publication_rate attribute")
-
-            # Try to fix media agents if they exist but weren't properly added to media_agents
-            if media_count > 0:
-                from mesa.agent import AgentSet
-
-                corporate_agents = [
-                    a
-                    for a in self.agents
-                    if hasattr(a, "publication_rate")
-                    and a.__class__.__name__ == "CorporateMediaAgent"
-                ]
-                influencer_agents = [
-                    a
-                    for a in self.agents
-                    if hasattr(a, "publication_rate")
-                    and a.__class__.__name__ == "InfluencerAgent"
-                ]
-                government_agents = [
-                    a
-                    for a in self.agents
-                    if hasattr(a, "publication_rate")
-                    and a.__class__.__name__ == "GovernmentMediaAgent"
-                ]
-
-                self.corporate_medias = AgentSet(corporate_agents, random=self.random)
-                self.influencers = AgentSet(influencer_agents, random=self.random)
-                self.government_medias = AgentSet(government_agents, random=self.random)
-
-                # Recreate combined set of all media agents - using the fixed approach
-                self.media_agents = AgentSet(
-                    [a for a in self.agents if hasattr(a, "publication_rate")],
-                    random=self.random,
-                )
+            logger.warning("No media agents found!")
+
+        # 1. Media agents create and publish content - with stricter control.
+        # Once every media type has published its one piece this is a no-op,
+        # so it is skipped outright for the rest of the run.
+        if not self._all_published:
+            logger.debug(
+                "Stepping %d media agents with content control", len(self.media_agents)
+            )
 
-                print(
-                    f"Fixed media agents: {len(self.corporate_medias)} corporate, {len(self.influencers)} influencers, {len(self.government_medias)} government, {len(self.media_agents)} total"
+            # Process each media agent category (ensuring only one piece of content per type)
+            for agent_type, chosen_one in self._media_reps:
+                # Only the representative publishes content for this category;
+                # types that have already published their one piece never step again
+                control = self.content_control[agent_type]
+                if control["representative_published"]:
+                    continue
+
+                logger.debug(
+                    "Stepping representative %s %s (will publish)",
+                    agent_type,
+                    chosen_one.unique_id,
                 )
-
-        # 1. Media agents create and publish content - with stricter control
-        print(f"Stepping {len(self.media_agents)} media agents with content control")
-        
-        # First, sort media agents by type to process them in groups
-        agent_groups = {}
-        for agent in self.media_agents:
-            agent_type = agent.__class__.__name__
-            if agent_type not in agent_groups:
-                agent_groups[agent_type] = []
-            agent_groups[agent_type].append(agent)
-        
-        # Now process each media agent category (ensuring only one piece of content per type)
-        for agent_type, agents in agent_groups.items():
-            if agent_type not in self.content_control:
-                print(f"Warning: Unknown agent type {agent_type} - skipping content control")
-                for agent in agents:
-                    agent.step()
-                continue
-                
-            # Check if this media type has already published its one piece of content
-            if self.content_control[agent_type]["has_published"]:
-                print(f"Skipping {len(agents)} {agent_type}s - category already published")
-                continue
-            
-            # Only allow one agent to publish content for this category
-            if not self.content_control[agent_type]["representative_published"]:
-                # Choose a representative agent for this media type
-                if agents:
-                    chosen_one = self.random.choice(agents)
-                    print(f"Stepping REPRESENTATIVE {agent_type} {chosen_one.unique_id} (will publish)")
-                    chosen_one.step()
-                    # Mark that this category has published its content
-                    self.content_control[agent_type]["has_published"] = True
-                    self.content_control[agent_type]["representative_published"] = True
-                    print(f"✓ {agent_type} has now published its ONE content piece")
-                else:
-                    print(f"No {agent_type} agents available to publish content")
+                chosen_one.step()
+                # Mark that this category has published its content
+                control["has_published"] = True
+                control["representative_published"] = True
+                logger.debug("%s has now published its one content piece", agent_type)
+
+            self._all_published = all(
+                self.content_control[agent_type]["has_published"]
+                for agent_type, _ in self._media_reps
+            )
 
         # 2. Citizen agents process social influence
-        print(f"Processing social influence for {len(self.citizens)} citizens")
         self.citizens.do("be_influenced_by_network")
 
         # 3. Truth-seeking citizens actively seek information
-        print(f"Processing information seeking for {len(self.citizens)} citizens")
         self.citizens.do("seek_information")
 
         # 4. Citizens share information with their connections
-        print(f"Stepping {len(self.citizens)} citizens")
         self.citizens.do("step")
 
-        # Collect data after the step
-        self.datacollector.collect(self)
+        # Collect data after the step (every collect_every steps)
+        if self.steps % self.collect_every == 0:
+            self._refresh_citizen_state()
+            self.datacollector.collect(self)
         
         # Store agent snapshots for individual tracking
         self._store_agent_snapshots()
 
         # Record metrics in stats collector
-        self._record_stats()
-
-        # Print trust metrics for debugging
-        avg_trust_govt = np.mean(
-            [a.trust_levels.get("GovernmentMediaAgent", 5.0) for a in self.citizens]
-        )
-        avg_trust_corp = np.mean(
-            [a.trust_levels.get("CorporateMediaAgent", 5.0) for a in self.citizens]
-        )
-        print(
-            f"After step {self.steps}: Avg govt trust = {avg_trust_govt:.4f}, Avg corp trust = {avg_trust_corp:.4f}"
+        metrics = self._record_stats()
+
+        # Print trust metrics for debugging, reusing the recorded averages
+        logger.debug(
+            "After step %d: Avg govt trust = %.4f, Avg corp trust = %.4f",
+            self.steps,
+            metrics["avg_trust_government"],
+            metrics["avg_trust_corporate"],
         )
         
-        # Print duplicate prevention statistics
-        if hasattr(self, "duplicate_prevention_stats"):
-            duplicates_prevented = self.duplicate_prevention_stats["duplicates_prevented"]
-            successful_shares = self.duplicate_prevention_stats["successful_shares"]
-            total_attempted = duplicates_prevented + successful_shares
-            prevention_percentage = 0 if total_attempted == 0 else (duplicates_prevented / total_attempted) * 100
-            
-            print(f"Duplicate prevention: {duplicates_prevented} duplicates prevented, "
-                  f"{successful_shares} successful unique shares "
-                  f"({prevention_percentage:.1f}% efficiency gain)")
-                  
-        # Print content statistics (3 content pieces total)
-        if hasattr(self, "content_tracker"):
-            content_count = len(self.content_tracker)
-            print(f"CONTENT SUMMARY: {content_count} content pieces in circulation")
-            
-            # Count how many nodes have received each content
-            for content_id, content in self.content_tracker.items():
-                spread_count = len(content.get("spread_path", []))
-                source_type = content.get("source_type", "Unknown")
-                accuracy = content.get("accuracy", 0.0)
-                content_type = "true" if accuracy >= 0.7 else "false" if accuracy <= 0.3 else "fuzzy"
-                
-                print(f"  - Content {content_id[-6:]} from {source_type}: "
-                      f"Reached {spread_count} nodes, accuracy={accuracy:.2f} ({content_type})")
+        if self.verbose:
+            self._print_step_summary()
 
         # Increment step counter (happens automatically in Mesa 3)
 
-    def _record_stats(self):
-        """Record detailed statistics for the current step."""
+    def _print_step_summary(self):
+        """Print duplicate-prevention statistics and the content summary."""
+        # Print duplicate prevention statistics
+        duplicates_prevented = self.duplicate_prevention_stats["duplicates_prevented"]
+        successful_shares = self.duplicate_prevention_stats["successful_shares"]
+        total_attempted = duplicates_prevented + successful_shares
+        prevention_percentage = 0 if total_attempted == 0 else (duplicates_prevented / total_attempted) * 100
+
+        lines = [
+            f"Duplicate prevention: {duplicates_prevented} duplicates prevented, "
+            f"{successful_shares} successful unique shares "
+            f"({prevention_percentage:.1f}% efficiency gain)",
+            # Print content statistics (3 content pieces total)
+            f"CONTENT SUMMARY: {len(self.content_tracker)} content pieces in circulation",
+        ]
+
+        # Count how many nodes have received each content
+        for content_id, content in self.content_tracker.items():
+            spread_count = len(content.get("spread_path", []))
+            source_type = content.get("source_type", "Unknown")
+            accuracy = content.get("accuracy", 0.0)
+            content_type = "true" if accuracy >= 0.7 else "false" if accuracy <= 0.3 else "fuzzy"
+
+            lines.append(
+                f"  - Content {content_id[-6:]} from {source_type}: "
+                f"Reached {spread_count} nodes, accuracy={accuracy:.2f} ({content_type})"
+            )
+
+        # One write instead of a print (and flush) per line
+        print("\n".join(lines))
+
+    def _record_stats(self) -> Dict[str, Any]:
+        """
+        Record detailed statistics for the current step.
+
+        Returns:
+            The metrics dictionary for this step
+        """
+        # One pass over the citizens, reused from _refresh_citizen_state when
+        # the DataCollector already ran this step; every reduction below runs
+        # on the arrays
+        gathered_step, state = self._citizen_columns
+        if gathered_step != self.steps:
+            state = self._gather_citizen_state()
+        truth = state[0]
+        trust = state[1:]  # rows follow MEDIA_SOURCE_TYPES
+        trust_corp, _, trust_govt = trust
+        trust_mean = trust.mean(axis=1)
+        trust_var = trust.var(axis=1)
+        govt_25pct, govt_75pct = np.percentile(trust_govt, [25, 75])
+
         metrics = {
             # Trust metrics
-            "avg_trust_corporate": np.mean(
-                [a.trust_levels.get("CorporateMediaAgent", 5.0) for a in self.citizens]
-            ),
-            "avg_trust_influencer": np.mean(
-                [a.trust_levels.get("InfluencerAgent", 5.0) for a in self.citizens]
-            ),
-            "avg_trust_government": np.mean(
-                [a.trust_levels.get("GovernmentMediaAgent", 5.0) for a in self.citizens]
-            ),
+            "avg_trust_corporate": trust_mean[0],
+            "avg_trust_influencer": trust_mean[1],
+            "avg_trust_government": trust_mean[2],
             # Trust variance metrics
-            "trust_var_corporate": np.var(
-                [a.trust_levels.get("CorporateMediaAgent", 5.0) for a in self.citizens]
-            ),
-            "trust_var_influencer": np.var(
-                [a.trust_levels.get("InfluencerAgent", 5.0) for a in self.citizens]
-            ),
-            "trust_var_government": np.var(
-                [a.trust_levels.get("GovernmentMediaAgent", 5.0) for a in self.citizens]
-            ),
+            "trust_var_corporate": trust_var[0],
+            "trust_var_influencer": trust_var[1],
+            "trust_var_government": trust_var[2],
             # Truth assessment metrics
-            "avg_truth_assessment": np.mean(
-                [a.truth_assessment for a in self.citizens]
-            ),
-            "truth_assessment_var": np.var([a.truth_assessment for a in self.citizens]),
+            "avg_truth_assessment": truth.mean(),
+            "truth_assessment_var": truth.var(),
             # Min/max metrics
-            "min_trust_corporate": min(
-                [a.trust_levels.get("CorporateMediaAgent", 5.0) for a in self.citizens]
-            ),
-            "max_trust_corporate": max(
-                [a.trust_levels.get("CorporateMediaAgent", 5.0) for a in self.citizens]
-            ),
-            "min_trust_government": min(
-                [a.trust_levels.get("GovernmentMediaAgent", 5.0) for a in self.citizens]
-            ),
-            "max_trust_government": max(
-                [a.trust_levels.get("GovernmentMediaAgent", 5.0) for a in self.citizens]
-            ),
+            "min_trust_corporate": trust_corp.min(),
+            "max_trust_corporate": trust_corp.max(),
+            "min_trust_government": trust_govt.min(),
+            "max_trust_government": trust_govt.max(),
             # Percentile metrics
-            "trust_govt_25pct": np.percentile(
-                [
-                    a.trust_levels.get("GovernmentMediaAgent", 5.0)
-                    for a in self.citizens
-                ],
-                25,
-            ),
-            "trust_govt_75pct": np.percentile(
-                [
-                    a.trust_levels.get("GovernmentMediaAgent", 5.0)
-                    for a in self.citizens
-                ],
-                75,
-            ),
+            "trust_govt_25pct": govt_25pct,
+            "trust_govt_75pct": govt_75pct,
             # Step number for reference
             "current_step": self.steps,
         }
         
         # Add information spread metrics if content_tracker exists
-        if hasattr(self, "content_tracker") and self.content_tracker:
+        if self.content_tracker:
             content_tracker = self.content_tracker
             
-            # Calculate spread statistics
-            spread_counts = [len(content.get("spread_path", [])) for content in content_tracker.values()]
-            
+            # Gather spread, accuracy and source grouping in a single pass;
+            # the remaining metrics are array reductions over the two columns
+            num_content = len(content_tracker)
+            spread_counts = np.empty(num_content, dtype=np.int64)
+            accuracies = np.empty(num_content)
+            source_totals = {}  # source type -> [total spread, content count]
+            for i, content in enumerate(content_tracker.values()):
+                spread = len(content.get("spread_path", []))
+                spread_counts[i] = spread
+                accuracies[i] = content.get("accuracy", 0.5)
+                totals = source_totals.setdefault(content.get("source_type", "Unknown"), [0, 0])
+                totals[0] += spread
+                totals[1] += 1
+
             # Add content metrics
-            metrics["total_content_created"] = len(content_tracker)
-            metrics["avg_content_spread"] = sum(spread_counts) / len(spread_counts) if spread_counts else 0
-            metrics["max_content_spread"] = max(spread_counts) if spread_counts else 0
-            
+            metrics["total_content_created"] = num_content
+            metrics["avg_content_spread"] = spread_counts.mean()
+            metrics["max_content_spread"] = int(spread_counts.max())
+
             # Calculate viral content count (content that reached >50% of the network)
             network_size = len(self.citizens)
             viral_threshold = network_size * 0.5
-            metrics["viral_content_count"] = sum(1 for count in spread_counts if count >= viral_threshold)
-            
+            metrics["viral_content_count"] = int((spread_counts >= viral_threshold).sum())
+
             # Source type spread effectiveness
-            source_spread = {}
-            for content_id, content in content_tracker.items():
-                source_type = content.get("source_type", "Unknown")
-                if source_type not in source_spread:
-                    source_spread[source_type] = []
-                source_spread[source_type].append(len(content.get("spread_path", [])))
-            
-            for source_type, spreads in source_spread.items():
-                metrics[f"avg_spread_{source_type}"] = sum(spreads) / len(spreads) if spreads else 0
-            
+            for source_type, (total_spread, count) in source_totals.items():
+                metrics[f"avg_spread_{source_type}"] = total_spread / count
+
             # Average content accuracy
-            accuracies = [content.get("accuracy", 0.5) for content in content_tracker.values()]
-            metrics["avg_content_accuracy"] = sum(accuracies) / len(accuracies) if accuracies else 0.5
-            
+            metrics["avg_content_accuracy"] = accuracies.mean()
+
             # Correlation between accuracy and spread
-            if spread_counts and accuracies and len(spread_counts) == len(accuracies):
-                try:
-                    correlation = np.corrcoef(accuracies, spread_counts)[0, 1]
-                    metrics["accuracy_spread_correlation"] = correlation
-                except:
-                    metrics["accuracy_spread_correlation"] = 0
-                    
+            metrics["accuracy_spread_correlation"] = _pearson(accuracies, spread_counts)
+
             # Track spread by content accuracy category (true/false/fuzzy)
+            is_true = accuracies >= 0.7  # accuracy >= 0.7
+            is_false = accuracies <= 0.3  # accuracy <= 0.3
             content_by_accuracy = {
-                "true_content": [],     # accuracy >= 0.7
-                "fuzzy_content": [],    # 0.3 < accuracy < 0.7
-                "false_content": []     # accuracy <= 0.3
+                "true_content": is_true,
+                "fuzzy_content": ~(is_true | is_false),  # 0.3 < accuracy < 0.7
+                "false_content": is_false,
             }
-            
-            for content_id, content in content_tracker.items():
-                accuracy = content.get("accuracy", 0.5)
-                spread = len(content.get("spread_path", []))
-                
-                if accuracy >= 0.7:
-                    content_by_accuracy["true_content"].append(spread)
-                elif accuracy <= 0.3:
-                    content_by_accuracy["false_content"].append(spread)
-                else:
-                    content_by_accuracy["fuzzy_content"].append(spread)
-            
-            # Calculate average spread for each content type
-            for content_type, spreads in content_by_accuracy.items():
-                metrics[f"avg_spread_{content_type}"] = sum(spreads) / len(spreads) if spreads else 0
-                
-            # Calculate count for each content type
-            for content_type, spreads in content_by_accuracy.items():
-                metrics[f"count_{content_type}"] = len(spreads)
+
+            # Calculate average spread and count for each content type
+            for content_type, mask in content_by_accuracy.items():
+                spreads = spread_counts[mask]
+                metrics[f"avg_spread_{content_type}"] = spreads.mean() if spreads.size else 0
+                metrics[f"count_{content_type}"] = int(spreads.size)
 
         # Don't actually record metrics in the database - this would conflict with the web interface
         # We just store them in memory for the model's internal use
         # self.stats.record_step(self.steps, metrics)  <- IMPORTANT: Commented out to avoid duplicate recording
 
+        return metrics
+
 
 def create_model(
     num_citizens=100,
@@ -902,6 +1017,12 @@ def create_model(
     small_world_p=0.1,
     scale_free_m=3,
     random_p=0.1,
+    # Data Collection Parameters
+    collect_every=1,
+    # Media Agent Parameters
+    simplified=False,
+    # Output Parameters
+    verbose=False,
 ):
     """
     Create and setup a model with customizable parameters.
@@ -975,6 +1096,19 @@ def create_model(
         random_p: Connection probability in random network
             Higher values create more dense random networks
 
+        # Data Collection Parameters
+        collect_every: Run the DataCollector only every this many steps (int >= 1)
+            Use larger values for long runs where only the trend or end state matters
+
+        # Media Agent Parameters
+        simplified: Create exactly one agent of each media type
+            Only one agent per type ever publishes, so this gives the same
+            three content pieces with fewer media agents to set up
+
+        # Output Parameters
+        verbose: Print the duplicate-prevention and content summary after
+            every step
+
     Returns:
         A fully configured InformationFlowModel ready for simulation
     """
@@ -1027,6 +1161,9 @@ def create_model(
         media_params=media_params,
         network_params=network_params,
         seed=seed,
+        collect_every=collect_every,
+        simplified=simplified,
+        verbose=verbose,
     )
 
     # Setup connections
@@ -5,7 +5,8 @@ This module provides helper functions for creating different types of
 social networks for the InfoFlow simulation.
 """
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import networkx as nx
 
@@ -98,6 +99,47 @@ def create_network(
     Returns:
         A networkx graph object of the specified type
     """
+    # Without a seed every call must produce a fresh random graph; without
+    # params (or with unhashable param values) there is no usable cache key
+    if seed is None or not params:
+        return _build_network(network_type, num_nodes, params or {}, seed)
+    frozen_params = tuple(sorted(params.items()))
+    try:
+        hash(frozen_params)
+    except TypeError:
+        return _build_network(network_type, num_nodes, params, seed)
+
+    # Seeded networks are deterministic, so parameter sweeps that rebuild
+    # the same network reuse its cached node and edge lists. Rebuilding from
+    # them is cheaper than rerunning the generator (or copying a graph), and
+    # each caller gets its own mutable graph (NetworkGrid stores agents on
+    # the graph's nodes).
+    nodes, edges = _cached_network(network_type, num_nodes, frozen_params, seed)
+    G = nx.Graph()
+    G.add_nodes_from(nodes)
+    G.add_edges_from(edges)
+    return G
+
+
+@lru_cache(maxsize=32)
+def _cached_network(
+    network_type: str,
+    num_nodes: int,
+    frozen_params: Tuple[Tuple[Any, Any], ...],
+    seed: int,
+) -> Tuple[Tuple[Any, ...], Tuple[Tuple[Any, Any], ...]]:
+    """Build a seeded network once and keep its nodes and edges."""
+    G = _build_network(network_type, num_nodes, dict(frozen_params), seed)
+    return tuple(G.nodes), tuple(G.edges)
+
+
+def _build_network(
+    network_type: str,
+    num_nodes: int,
+    params: Dict[str, Any],
+    seed: Optional[int] = None,
+) -> nx.Graph:
+    """Build a network of the specified type (see create_network)."""
     # Safety check: For very small networks, default to complete graph
     if num_nodes <= 3:
         print(f"Network too small (n={num_nodes}), using complete graph instead")
@@ -2,12 +2,47 @@
 Data collection utilities for InfoFlow social media simulation.
 """
 
+from itertools import chain
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 import numpy as np
 
-from infoflow.utils.helpers import calculate_variance
+from infoflow.agents.base import MEDIA_SOURCE_TYPES, get_media_trust
 from infoflow.data.metrics import calculate_polarization, calculate_opinion_clusters
 
+# Citizen attributes stored by collect_cognitive_parameters as current_<name>
+COGNITIVE_PARAMETERS = (
+    "confirmation_bias",
+    "critical_thinking",
+    "social_conformity",
+    "truth_seeking",
+    "influence",
+    "confidence",
+)
+
+# Scalar citizen attributes read by the collect_* methods
+CITIZEN_FIELDS = ("truth_assessment", *COGNITIVE_PARAMETERS)
+
+_get_citizen_fields = attrgetter(*CITIZEN_FIELDS)
+
+# Per-agent snapshot values decoded by get_agent_metrics, with the defaults
+# used for missing entries; the trust entries come from "trust_levels"
+SNAPSHOT_DEFAULTS = {
+    "truth_assessment": 0.5,
+    "CorporateMediaAgent": 5.0,
+    "InfluencerAgent": 5.0,
+    "GovernmentMediaAgent": 5.0,
+    "confirmation_bias": 5.0,
+    "critical_thinking": 5.0,
+    "social_conformity": 5.0,
+    "truth_seeking": 0.0,
+}
+SNAPSHOT_COLUMNS = tuple(SNAPSHOT_DEFAULTS)
+
+# Content accuracy categories, in label order: true (accuracy >= 0.7),
+# fuzzy (0.3 < accuracy < 0.7) and false (accuracy <= 0.3)
+ACCURACY_CATEGORIES = ("true_content", "fuzzy_content", "false_content")
+
 
 class DataCollector:
     """Collects and stores simulation data."""
@@ -27,59 +62,90 @@ class DataCollector:
             
             # Current snapshot data will be added as needed
         }
+        # Citizen arrays shared by the collect_* methods during collect_all
+        self._citizen_arrays = None
+        # (model step, decoded snapshots) cached by _materialize_snapshots
+        self._snapshot_tensor = None
+
+    def _snapshot(self) -> Dict[str, np.ndarray]:
+        """
+        Read every citizen attribute the collect_* methods use.
+
+        Within collect_all this is one pass over the citizens shared by all
+        methods; a collect_* method called on its own takes a fresh snapshot.
+
+        Returns:
+            Dictionary with one contiguous float64 array per CITIZEN_FIELDS
+            name, plus "trust": a (source type x citizen) matrix whose rows
+            follow MEDIA_SOURCE_TYPES
+        """
+        if self._citizen_arrays is not None:
+            return self._citizen_arrays
+
+        citizens = self.model.citizens
+        width = len(CITIZEN_FIELDS) + len(MEDIA_SOURCE_TYPES)
+        values = np.fromiter(
+            chain.from_iterable(
+                (*_get_citizen_fields(agent), *get_media_trust(agent.trust_levels))
+                for agent in citizens
+            ),
+            dtype=np.float64,
+            count=len(citizens) * width,
+        )
+        columns = np.ascontiguousarray(values.reshape(-1, width).T)
+
+        arrays = dict(zip(CITIZEN_FIELDS, columns))
+        arrays["trust"] = columns[len(CITIZEN_FIELDS):]
+        return arrays
 
     def collect_truth_assessment_metrics(self):
         """Collect metrics related to truth assessment distribution."""
-        citizens = self.model.citizens
-        truth_assessments = [agent.truth_assessment for agent in citizens]
+        truth_assessments = self._snapshot()["truth_assessment"]
         
         # Store current truth assessments for distribution analysis
-        self.data["current_truth_assessments"] = truth_assessments
+        self.data["current_truth_assessments"] = truth_assessments.tolist()
         
         # Calculate and store time series metrics
-        mean_truth = sum(truth_assessments) / len(truth_assessments) if truth_assessments else 0
-        variance = calculate_variance(truth_assessments)
+        if truth_assessments.size:
+            mean_truth = float(truth_assessments.mean())
+            variance = float(truth_assessments.var())
+        else:
+            mean_truth = variance = 0
         
         self.data["mean_truth_assessment"].append(mean_truth)
         self.data["truth_assessment_variance"].append(variance)
         
-        # Calculate polarization and opinion clusters
-        polarization = calculate_polarization(truth_assessments)
-        opinion_clusters = calculate_opinion_clusters(truth_assessments)
+        # Calculate polarization and opinion clusters from one shared sort
+        sorted_assessments = np.sort(truth_assessments)
+        polarization = calculate_polarization(sorted_assessments, presorted=True)
+        opinion_clusters = calculate_opinion_clusters(sorted_assessments, presorted=True)
         
         self.data["polarization_over_time"].append(polarization)
         self.data["opinion_clusters_over_time"].append(opinion_clusters)
 
     def collect_trust_metrics(self):
         """Collect metrics related to trust levels."""
-        citizens = self.model.citizens
+        # (source type x citizen) trust matrix; rows follow MEDIA_SOURCE_TYPES
+        trust_matrix = self._snapshot()["trust"]
+        if trust_matrix.shape[1]:
+            avg_trusts = trust_matrix.mean(axis=1)
+        else:
+            avg_trusts = np.full(len(MEDIA_SOURCE_TYPES), 5.0)
         
-        # Calculate average trust for each source type
-        for source_type in [
-            "CorporateMediaAgent",
-            "InfluencerAgent",
-            "GovernmentMediaAgent",
-        ]:
-            trust_values = [agent.trust_levels.get(source_type, 5.0) for agent in citizens]
-            
-            # Store current trust values for distribution analysis
-            self.data[f"current_trust_in_{source_type}"] = trust_values
-            
-            # Calculate and store time series metrics
-            avg_trust = sum(trust_values) / len(trust_values) if trust_values else 5.0
-            self.data[f"trust_in_{source_type}"].append(avg_trust)
+        # Store current trust values and average trust for each source type
+        for source_type, trust_values, avg_trust in zip(
+            MEDIA_SOURCE_TYPES, trust_matrix, avg_trusts
+        ):
+            self.data[f"current_trust_in_{source_type}"] = trust_values.tolist()
+            self.data[f"trust_in_{source_type}"].append(float(avg_trust))
 
     def collect_cognitive_parameters(self):
         """Collect data about agent cognitive parameters."""
-        citizens = self.model.citizens
+        arrays = self._snapshot()
         
         # Store current parameter values for distribution analysis
-        self.data["current_confirmation_bias"] = [agent.confirmation_bias for agent in citizens]
-        self.data["current_critical_thinking"] = [agent.critical_thinking for agent in citizens]
-        self.data["current_social_conformity"] = [agent.social_conformity for agent in citizens]
-        self.data["current_truth_seeking"] = [agent.truth_seeking for agent in citizens]
-        self.data["current_influence"] = [agent.influence for agent in citizens]
-        self.data["current_confidence"] = [agent.confidence for agent in citizens]
+        for name in COGNITIVE_PARAMETERS:
+            self.data[f"current_{name}"] = arrays[name].tolist()
 
     def collect_content_metrics(self):
         """Collect metrics related to content sharing and propagation."""
@@ -88,90 +154,87 @@ class DataCollector:
             return
             
         content_tracker = self.model.content_tracker
+        num_content = len(content_tracker)
         
         # Total number of content pieces created
-        self.data["total_content_created"] = len(content_tracker)
+        self.data["total_content_created"] = num_content
         
-        # Calculate spread statistics
-        spread_counts = [len(content.get("spread_path", [])) for content in content_tracker.values()]
+        # Gather spread, accuracy and source type in a single pass; every
+        # metric below is computed from these
+        spread_counts = np.empty(num_content, dtype=np.int64)
+        accuracies = np.empty(num_content)
+        source_types = []
+        for i, content in enumerate(content_tracker.values()):
+            spread_counts[i] = len(content.get("spread_path", []))
+            accuracies[i] = content.get("accuracy", 0.5)
+            source_types.append(content.get("source_type", "Unknown"))
         
         # Average content spread
-        self.data["avg_content_spread"] = sum(spread_counts) / len(spread_counts) if spread_counts else 0
+        self.data["avg_content_spread"] = float(spread_counts.mean()) if num_content else 0.0
         
         # Maximum content spread
-        self.data["max_content_spread"] = max(spread_counts) if spread_counts else 0
+        self.data["max_content_spread"] = int(spread_counts.max()) if num_content else 0
         
         # Calculate viral content count (content that reached >50% of the network)
         network_size = len(self.model.citizens) if hasattr(self.model, "citizens") else 100
         viral_threshold = network_size * 0.5
-        self.data["viral_content_count"] = sum(1 for count in spread_counts if count >= viral_threshold)
+        self.data["viral_content_count"] = int((spread_counts >= viral_threshold).sum())
+        
+        # Group by source type: count and sum spreads per distinct source
+        sources, source_idx = np.unique(source_types, return_inverse=True)
+        source_counts = np.bincount(source_idx, minlength=len(sources))
+        source_spread_sums = np.bincount(
+            source_idx, weights=spread_counts, minlength=len(sources)
+        )
         
         # Content by source type
-        content_by_source = {}
-        for content in content_tracker.values():
-            source_type = content.get("source_type", "Unknown")
-            if source_type not in content_by_source:
-                content_by_source[source_type] = 0
-            content_by_source[source_type] += 1
-            
-        self.data["content_by_source"] = content_by_source
+        self.data["content_by_source"] = dict(zip(sources.tolist(), source_counts.tolist()))
         
         # Source type spread effectiveness (avg spread per source)
-        source_spread = {}
-        for content_id, content in content_tracker.items():
-            source_type = content.get("source_type", "Unknown")
-            if source_type not in source_spread:
-                source_spread[source_type] = []
-            source_spread[source_type].append(len(content.get("spread_path", [])))
-        
-        for source_type, spreads in source_spread.items():
-            self.data[f"avg_spread_{source_type}"] = sum(spreads) / len(spreads) if spreads else 0
+        for source_type, spread_sum, count in zip(
+            sources.tolist(), source_spread_sums, source_counts
+        ):
+            self.data[f"avg_spread_{source_type}"] = float(spread_sum / count)
         
         # Average content accuracy
-        accuracies = [content.get("accuracy", 0.5) for content in content_tracker.values()]
-        self.data["avg_content_accuracy"] = sum(accuracies) / len(accuracies) if accuracies else 0.5
-        
-        # Track correlation between content accuracy and spread
-        if spread_counts and accuracies and len(spread_counts) == len(accuracies):
-            try:
-                import numpy as np
-                correlation = np.corrcoef(accuracies, spread_counts)[0, 1]
-                self.data["accuracy_spread_correlation"] = correlation
-            except:
-                self.data["accuracy_spread_correlation"] = 0
-                
-        # Track spread by content accuracy category (true/false/fuzzy)
-        content_by_accuracy = {
-            "true_content": [],     # accuracy >= 0.7
-            "fuzzy_content": [],    # 0.3 < accuracy < 0.7
-            "false_content": []     # accuracy <= 0.3
-        }
+        self.data["avg_content_accuracy"] = float(accuracies.mean()) if num_content else 0.5
         
-        for content_id, content in content_tracker.items():
-            accuracy = content.get("accuracy", 0.5)
-            spread = len(content.get("spread_path", []))
-            
-            if accuracy >= 0.7:
-                content_by_accuracy["true_content"].append(spread)
-            elif accuracy <= 0.3:
-                content_by_accuracy["false_content"].append(spread)
+        # Track correlation between content accuracy and spread (undefined,
+        # reported as 0.0, when either is constant)
+        if num_content:
+            if accuracies.var() > 0 and spread_counts.var() > 0:
+                correlation = float(np.corrcoef(accuracies, spread_counts)[0, 1])
             else:
-                content_by_accuracy["fuzzy_content"].append(spread)
+                correlation = 0.0
+            self.data["accuracy_spread_correlation"] = correlation
+                
+        # Track spread by content accuracy category (true/false/fuzzy):
+        # label each item, then count and sum spreads per label in one go
+        categories = np.where(accuracies >= 0.7, 0, np.where(accuracies <= 0.3, 2, 1))
+        counts = np.bincount(categories, minlength=len(ACCURACY_CATEGORIES))
+        spread_sums = np.bincount(
+            categories, weights=spread_counts, minlength=len(ACCURACY_CATEGORIES)
+        )
+        avg_spreads = np.divide(
+            spread_sums, counts, out=np.zeros(len(ACCURACY_CATEGORIES)), where=counts > 0
+        )
         
-        # Calculate average spread for each content type
-        for content_type, spreads in content_by_accuracy.items():
-            self.data[f"avg_spread_{content_type}"] = sum(spreads) / len(spreads) if spreads else 0
-            
-        # Calculate count for each content type
-        for content_type, spreads in content_by_accuracy.items():
-            self.data[f"count_{content_type}"] = len(spreads)
+        # Store average spread and count for each content type
+        for content_type, avg_spread, count in zip(ACCURACY_CATEGORIES, avg_spreads, counts):
+            self.data[f"avg_spread_{content_type}"] = float(avg_spread)
+            self.data[f"count_{content_type}"] = int(count)
 
     def collect_all(self):
         """Collect all metrics."""
-        self.collect_truth_assessment_metrics()
-        self.collect_trust_metrics()
-        self.collect_cognitive_parameters()
-        self.collect_content_metrics()
+        # Read the citizens once for all the collect_* methods below
+        self._citizen_arrays = self._snapshot()
+        try:
+            self.collect_truth_assessment_metrics()
+            self.collect_trust_metrics()
+            self.collect_cognitive_parameters()
+            self.collect_content_metrics()
+        finally:
+            self._citizen_arrays = None
         return self.data
         
     def get_agent_snapshots(self):
@@ -190,9 +253,10 @@ class DataCollector:
         Returns:
             Dictionary with time series data for the agent
         """
-        snapshots = self.get_agent_snapshots()
-        if not snapshots:
+        materialized = self._materialize_snapshots()
+        if materialized is None:
             return None
+        agent_index, present, values = materialized
             
         agent_metrics = {
             "truth_assessment": [],
@@ -206,23 +270,78 @@ class DataCollector:
             "social_conformity": [],
             "truth_seeking": [],
         }
+        if agent_id not in agent_index:
+            return agent_metrics
         
-        # Extract data from each time step
-        for step in sorted(snapshots.keys()):
-            if agent_id in snapshots[step]:
-                agent_data = snapshots[step][agent_id]
-                
-                # Extract metrics
-                agent_metrics["truth_assessment"].append(agent_data.get("truth_assessment", 0.5))
-                
-                for source_type in agent_metrics["trust_levels"].keys():
-                    agent_metrics["trust_levels"][source_type].append(
-                        agent_data.get("trust_levels", {}).get(source_type, 5.0)
-                    )
-                
-                agent_metrics["confirmation_bias"].append(agent_data.get("confirmation_bias", 5.0))
-                agent_metrics["critical_thinking"].append(agent_data.get("critical_thinking", 5.0))
-                agent_metrics["social_conformity"].append(agent_data.get("social_conformity", 5.0))
-                agent_metrics["truth_seeking"].append(agent_data.get("truth_seeking", 0.0))
+        # The agent's rows for the steps it appears in, one column per metric
+        idx = agent_index[agent_id]
+        columns = dict(zip(SNAPSHOT_COLUMNS, values[present[:, idx], idx].T.tolist()))
+        
+        for name, series in columns.items():
+            if name in agent_metrics["trust_levels"]:
+                agent_metrics["trust_levels"][name] = series
+            else:
+                agent_metrics[name] = series
                 
-        return agent_metrics
\ No newline at end of file
+        return agent_metrics
+
+    def _materialize_snapshots(self):
+        """
+        Gather the model's agent snapshots into arrays, once per model step.
+
+        Scanning the nested snapshot dicts for each agent made per-agent
+        lookups O(steps) of dict traversal; decoding everything in one pass
+        makes each lookup a column slice.
+
+        Returns:
+            Tuple of (agent_id -> column index dict, (steps x agents) bool
+            array of which agents appear at each step, (steps x agents x
+            SNAPSHOT_COLUMNS) float array of values), or None when the model
+            has no snapshots
+        """
+        cache_key = getattr(self.model, "steps", None)
+        cached = self._snapshot_tensor
+        if cache_key is not None and cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        # Models that record snapshots as per-step arrays (columns in
+        # SNAPSHOT_FIELDS order, which matches SNAPSHOT_COLUMNS) are stacked
+        # directly; the nested dicts are only decoded as a fallback
+        raw_snapshots = getattr(self.model, "_snapshots", None)
+        snapshot_ids = getattr(self.model, "_snapshot_ids", None)
+        if raw_snapshots and snapshot_ids is not None:
+            steps = sorted(raw_snapshots)
+            values = np.stack([raw_snapshots[step] for step in steps])
+            agent_index = {agent_id: i for i, agent_id in enumerate(snapshot_ids)}
+            present = np.ones(values.shape[:2], dtype=bool)
+            materialized = (agent_index, present, values)
+            self._snapshot_tensor = (cache_key, materialized)
+            return materialized
+
+        snapshots = self.get_agent_snapshots()
+        if not snapshots:
+            return None
+
+        steps = sorted(snapshots.keys())
+        agent_index = {}
+        for step in steps:
+            for agent_id in snapshots[step]:
+                agent_index.setdefault(agent_id, len(agent_index))
+
+        present = np.zeros((len(steps), len(agent_index)), dtype=bool)
+        values = np.zeros((len(steps), len(agent_index), len(SNAPSHOT_COLUMNS)))
+        for step_idx, step in enumerate(steps):
+            for agent_id, agent_data in snapshots[step].items():
+                idx = agent_index[agent_id]
+                trust_levels = agent_data.get("trust_levels", {})
+                present[step_idx, idx] = True
+                values[step_idx, idx] = [
+                    trust_levels.get(name, default)
+                    if name in MEDIA_SOURCE_TYPES
+                    else agent_data.get(name, default)
+                    for name, default in SNAPSHOT_DEFAULTS.items()
+                ]
+
+        materialized = (agent_index, present, values)
+        self._snapshot_tensor = (cache_key, materialized)
+        return materialized
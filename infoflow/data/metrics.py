@@ -2,12 +2,14 @@
 Metric definitions for InfoFlow simulation.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 import numpy as np
 
 
-def calculate_polarization(truth_assessments: List[float]) -> float:
+def calculate_polarization(
+    truth_assessments: Sequence[float], presorted: bool = False
+) -> float:
     """
     Calculate polarization index based on truth assessment distribution.
 
@@ -15,26 +17,29 @@ def calculate_polarization(truth_assessments: List[float]) -> float:
 
     Args:
         truth_assessments: List of agent truth assessments (0-1 scale)
+        presorted: Whether truth_assessments is already sorted ascending
 
     Returns:
         Polarization index
     """
-    # Simple implementation - can be enhanced
-    sorted_assessments = sorted(truth_assessments)
-    n = len(sorted_assessments)
+    n = len(truth_assessments)
 
     if n <= 1:
         return 0.0
 
-    # Calculate average difference between consecutive truth assessments
-    diffs = [sorted_assessments[i + 1] - sorted_assessments[i] for i in range(n - 1)]
-
+    # Average difference between consecutive sorted truth assessments. The
+    # sum of those gaps telescopes to max - min, so no sort is needed.
     # Larger gaps suggest polarization
-    return sum(diffs) / (n - 1)
+    if presorted:
+        spread = truth_assessments[-1] - truth_assessments[0]
+    else:
+        assessments = np.asarray(truth_assessments, dtype=float)
+        spread = assessments.max() - assessments.min()
+    return float(spread / (n - 1))
 
 
 def calculate_opinion_clusters(
-    truth_assessments: List[float], threshold: float = 0.1
+    truth_assessments: Sequence[float], threshold: float = 0.1, presorted: bool = False
 ) -> int:
     """
     Calculate the number of opinion clusters in the population.
@@ -42,25 +47,31 @@ def calculate_opinion_clusters(
     Args:
         truth_assessments: List of agent truth assessments (0-1 scale)
         threshold: Minimum gap between clusters
+        presorted: Whether truth_assessments is already sorted ascending
 
     Returns:
         Number of distinct opinion clusters
     """
-    if not truth_assessments:
+    if len(truth_assessments) == 0:
         return 0
 
-    sorted_assessments = sorted(truth_assessments)
-    n = len(sorted_assessments)
+    assessments = np.asarray(truth_assessments, dtype=float)
 
-    # Start with one cluster
-    clusters = 1
+    # No gap can exceed the overall range, so a population spread over no
+    # more than the threshold is a single cluster; this skips the sort and
+    # gap scan in the common early state where opinions are still close
+    if presorted:
+        value_range = assessments[-1] - assessments[0]
+    else:
+        value_range = assessments.max() - assessments.min()
+    if value_range <= threshold:
+        return 1
 
-    # Check for gaps between consecutive sorted assessments
-    for i in range(n - 1):
-        if sorted_assessments[i + 1] - sorted_assessments[i] > threshold:
-            clusters += 1
+    sorted_assessments = assessments if presorted else np.sort(assessments)
 
-    return clusters
+    # Start with one cluster and add one for every gap between consecutive
+    # sorted assessments that is wider than the threshold
+    return 1 + int(np.count_nonzero(np.diff(sorted_assessments) > threshold))
 
 
 def calculate_truth_correlation(
@@ -79,20 +90,17 @@ def calculate_truth_correlation(
     if len(truth_assessments) != len(actual_truths) or len(truth_assessments) == 0:
         return 0.0
 
-    # Calculate means
-    mean_assessment = sum(truth_assessments) / len(truth_assessments)
-    mean_truth = sum(actual_truths) / len(actual_truths)
+    # Center both series; covariance and variances are then dot products
+    assessments = np.asarray(truth_assessments, dtype=np.float64)
+    truths = np.asarray(actual_truths, dtype=np.float64)
+    assessments = assessments - assessments.mean()
+    truths = truths - truths.mean()
 
-    # Calculate covariance and variances
-    covariance = sum(
-        (a - mean_assessment) * (t - mean_truth)
-        for a, t in zip(truth_assessments, actual_truths)
-    )
-    var_assessment = sum((a - mean_assessment) ** 2 for a in truth_assessments)
-    var_truth = sum((t - mean_truth) ** 2 for t in actual_truths)
+    var_assessment = np.dot(assessments, assessments)
+    var_truth = np.dot(truths, truths)
 
     # Avoid division by zero
     if var_assessment == 0 or var_truth == 0:
         return 0.0
 
-    return covariance / (np.sqrt(var_assessment) * np.sqrt(var_truth))
+    return float(np.dot(assessments, truths) / np.sqrt(var_assessment * var_truth))
@@ -150,7 +150,7 @@ def create_network_visualization(model, node_color_attribute: str = "truth_asses
         # Get attribute values for coloring
         node_colors = []
         for i in range(len(G.nodes())):
-            agent = model.grid.get_cell_list_contents([i])[0]
+            agent = model.node_citizens[i]
             value = getattr(
                 agent, node_color_attribute, 0.5
             )  # Default 0.5 if attribute not found
@@ -18,3 +18,4 @@ def calculate_variance(values):
 
     mean = sum(values) / len(values)
     return sum((x - mean) ** 2 for x in values) / len(values)
+
@@ -1132,10 +1132,9 @@ def get_network_data(model):
     nodes = []
     for i in G.nodes():
         # Get the agent at this node if it exists
-        agents = model.grid.get_cell_list_contents([i])
+        agent = model.node_citizens[i]
         
-        if agents:
-            agent = agents[0]  # Get the first agent (should be a CitizenAgent)
+        if agent is not None:
             agent_id = str(agent.unique_id)
             
             # Check if this agent is a seed node for any content
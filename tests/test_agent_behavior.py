@@ -98,6 +98,9 @@ class AgentBehaviorTestModel(mesa.Model):
         self.influencers = [self.influencer]
         self.government_medias = [self.government]
         
+        # Seed node registry that media broadcasts record into
+        self.content_seed_nodes = {}
+        
         # Create AgentSet of all citizens for testing
         from mesa.agent import AgentSet
         self.citizens = AgentSet(
@@ -462,6 +465,33 @@ def test_seeking_behavior(verbose=False):
     return model
 
 
+def test_influencer_follower_management(verbose=False):
+    """Test that influencers keep an ordered, duplicate-free follower list."""
+    model = AgentBehaviorTestModel(seed=42)
+    influencer = model.influencer
+
+    # Adding an existing follower again should not duplicate it
+    influencer.add_follower(model.truth_seeker)
+    influencer.add_follower(model.neutral)
+    influencer.add_follower(model.truth_avoider)
+    assert influencer.followers == [model.truth_seeker, model.neutral, model.truth_avoider]
+
+    # Removing keeps the remaining follow order; removing twice is a no-op
+    influencer.remove_follower(model.neutral)
+    influencer.remove_follower(model.neutral)
+    assert influencer.followers == [model.truth_seeker, model.truth_avoider]
+
+    # Broadcasts reach followers first and never deliver to anyone twice
+    reached = influencer.broadcast_content(influencer.create_content())
+    assert reached[:2] == [model.truth_seeker, model.truth_avoider]
+    assert len(reached) == len(set(reached))
+
+    if verbose:
+        print(f"Influencer followers: {[f.unique_id for f in influencer.followers]}")
+        print("✓ Influencer follower management test passed")
+    return model
+
+
 if __name__ == "__main__":
     # Run all tests with verbose output
     print("Testing truth assessment updating...")
@@ -479,6 +509,9 @@ if __name__ == "__main__":
     print("\nTesting media agent broadcasting...")
     test_media_agent_broadcasting(verbose=True)
     
+    print("\nTesting influencer follower management...")
+    test_influencer_follower_management(verbose=True)
+    
     print("\nTesting seeking behavior...")
     test_seeking_behavior(verbose=True)
     
@@ -16,6 +16,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 # Import the model and agent classes
 from infoflow.core.model import InformationFlowModel, create_model
+from infoflow.core.network import _cached_network, create_network
 from infoflow.agents.base import CitizenAgent, SocialMediaAgent
 from infoflow.agents.media.corporate import CorporateMediaAgent
 from infoflow.agents.media.influencer import InfluencerAgent
@@ -173,6 +174,102 @@ def test_data_collection(verbose=False):
     return model, model_data, agent_data
 
 
+def test_sparse_data_collection(verbose=False):
+    """Test that collect_every thins out the collected data."""
+    model = create_model(
+        num_citizens=30,
+        num_corporate_media=2,
+        num_influencers=3,
+        num_government=1,
+        network_type="small_world",
+        seed=42,
+        collect_every=3,
+    )
+
+    # Run for several steps
+    num_steps = 10
+    for i in range(num_steps):
+        model.step()
+
+    model_data = model.datacollector.get_model_vars_dataframe()
+
+    if verbose:
+        print(f"Collected {len(model_data)} rows over {num_steps} steps")
+
+    # Initial state plus steps 3, 6 and 9
+    assert len(model_data) == 1 + num_steps // 3
+
+    return model, model_data
+
+
+def test_invalid_collect_every(verbose=False):
+    """Test that collect_every must be a positive integer."""
+    for collect_every in (0, -1, 2.5, True):
+        try:
+            create_model(num_citizens=10, seed=42, collect_every=collect_every)
+        except ValueError as error:
+            if verbose:
+                print(f"collect_every={collect_every!r} rejected: {error}")
+        else:
+            raise AssertionError(f"collect_every={collect_every!r} was accepted")
+
+
+def test_simplified_media(verbose=False):
+    """Test that simplified mode creates one agent per media type."""
+    model = create_model(
+        num_citizens=30,
+        num_corporate_media=2,
+        num_influencers=3,
+        num_government=1,
+        network_type="small_world",
+        seed=42,
+        simplified=True,
+    )
+
+    assert len(model.corporate_medias) == 1
+    assert len(model.influencers) == 1
+    assert len(model.government_medias) == 1
+
+    # Still exactly one content piece per media type
+    for i in range(3):
+        model.step()
+
+    if verbose:
+        print(f"Simplified model has {len(model.media_agents)} media agents")
+        print(f"Content pieces in circulation: {len(model.content_tracker)}")
+
+    assert len(model.content_tracker) == 3
+
+    return model
+
+
+def test_seeded_network_reuse(verbose=False):
+    """Test that models with the same seed get equal but independent networks."""
+    _cached_network.cache_clear()
+    model_a = create_model(num_citizens=40, network_type="scale_free", seed=7)
+    hits = _cached_network.cache_info().hits
+    model_b = create_model(num_citizens=40, network_type="scale_free", seed=7)
+
+    # The second model's network comes from the cache
+    assert _cached_network.cache_info().hits == hits + 1
+
+    # Same topology, but each model owns its graph (agents live on its nodes)
+    assert model_a.G is not model_b.G
+    assert set(model_a.G.edges()) == set(model_b.G.edges())
+    for node in model_a.G.nodes():
+        assert model_a.G.nodes[node]["agent"] != model_b.G.nodes[node]["agent"]
+
+    # Unseeded networks must stay random, so they bypass the cache
+    cache_info = _cached_network.cache_info()
+    create_network("scale_free", 40, model_a.network_params, seed=None)
+    assert _cached_network.cache_info() == cache_info
+
+    if verbose:
+        print(f"Shared topology: {model_a.G.number_of_edges()} edges")
+
+    return model_a, model_b
+
+
 if __name__ == "__main__":
     # Run tests with verbose output
     print("Testing model initialization...")
@@ -184,4 +281,16 @@ if __name__ == "__main__":
     print("\nTesting data collection...")
     model, model_data, agent_data = test_data_collection(verbose=True)
     
+    print("\nTesting sparse data collection...")
+    model, model_data = test_sparse_data_collection(verbose=True)
+    
+    print("\nTesting invalid collect_every...")
+    test_invalid_collect_every(verbose=True)
+    
+    print("\nTesting simplified media...")
+    model = test_simplified_media(verbose=True)
+
+    print("\nTesting seeded network reuse...")
+    model_a, model_b = test_seeded_network_reuse(verbose=True)
+    
     print("\nAll tests completed successfully!")
\ No newline at end of file